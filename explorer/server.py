@@ -1,22 +1,24 @@
 """FastAPI server for the Knowledge Store Explorer."""
 
-import json
+import asyncio
+import os
 import sqlite3
+import threading
+from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
 
 import hnswlib
 import numpy as np
+import orjson
 import uvicorn
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, Response
 from fastapi.templating import Jinja2Templates
 
 from research_agent.config import Config
 from research_agent.embeddings import QwenEmbedder
 
-app = FastAPI(title="Knowledge Store Explorer")
-
 # Embedder singleton
 _embedder: QwenEmbedder | None = None
 
@@ -29,20 +31,60 @@ def get_embedder() -> QwenEmbedder:
     return _embedder
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Load the embedding model in background on startup."""
-    import threading
+def load_embedder() -> None:
+    """Load the embedding model so the first search doesn't pay for it."""
+    print("Loading embedding model in background...")
+    embedder = get_embedder()
+    if not embedder.is_loaded:
+        embedder._load_model()
+    print(f"Embedding model loaded on {embedder.device}")
+
+
+async def wait_for_embedder(app: FastAPI) -> None:
+    """
+    Wait until the embedding model is loaded.
+
+    Joins the load started at startup, or starts a new one if there is none
+    (the app ran without its lifespan) or the last attempt failed.
+    """
+    ready = getattr(app.state, "embedder_ready", None)
+    if ready is None or (ready.done() and (ready.cancelled() or ready.exception())):
+        ready = app.state.embedder_ready = asyncio.create_task(asyncio.to_thread(load_embedder))
+    await ready
+
+
+def prefetch_indices() -> None:
+    """Pull every store's HNSW index into the page cache and the index cache."""
+    index_paths = sorted(get_stores_dir().glob("*.index"))
+
+    # Ask the kernel to start reading all index files before we load any of them
+    if hasattr(os, "posix_fadvise"):
+        for index_path in index_paths:
+            fd = os.open(index_path, os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            finally:
+                os.close(fd)
+
+    for index_path in index_paths:
+        try:
+            get_index(index_path.stem)
+        except Exception as e:
+            print(f"Could not preload index for {index_path.stem}: {e}")
+    print(f"Preloaded {len(index_paths)} HNSW indices")
+
 
-    def load_embedder():
-        print("Loading embedding model in background...")
-        embedder = get_embedder()
-        if not embedder.is_loaded:
-            embedder._load_model()
-        print(f"Embedding model loaded on {embedder.device}")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm the embedder and indices in background; close connections on shutdown."""
+    # Search routes await this before embedding, so they never race the load
+    app.state.embedder_ready = asyncio.create_task(asyncio.to_thread(load_embedder))
+    threading.Thread(target=prefetch_indices, daemon=True).start()
+    yield
+    close_store_connections()
 
-    thread = threading.Thread(target=load_embedder, daemon=True)
-    thread.start()
+
+app = FastAPI(title="Knowledge Store Explorer", lifespan=lifespan)
 
 # Templates directory
 TEMPLATES_DIR = Path(__file__).parent / "templates"
@@ -54,278 +96,383 @@ def get_stores_dir() -> Path:
     return Config.KNOWLEDGE_STORE_DIR
 
 
-def list_stores() -> list[dict]:
+def get_store_summary(store_name: str) -> dict:
+    """Get finding count and date range for a single store."""
+    try:
+        conn = get_store_connection(store_name)
+        cursor = conn.execute(
+            "SELECT COUNT(*), MIN(created_at), MAX(created_at) FROM embeddings"
+        )
+        count, min_ts, max_ts = cursor.fetchone()
+
+        created = datetime.fromtimestamp(min_ts).strftime("%Y-%m-%d %H:%M") if min_ts else "N/A"
+        updated = datetime.fromtimestamp(max_ts).strftime("%Y-%m-%d %H:%M") if max_ts else "N/A"
+    except Exception:
+        count = 0
+        created = "N/A"
+        updated = "N/A"
+
+    return {
+        "name": store_name,
+        "finding_count": count,
+        "created": created,
+        "updated": updated,
+    }
+
+
+async def list_stores() -> list[dict]:
     """List all knowledge stores with metadata."""
     stores_dir = get_stores_dir()
     if not stores_dir.exists():
         return []
 
-    stores = []
-    for db_file in stores_dir.glob("*.db"):
-        store_name = db_file.stem
+    # Probe all stores concurrently in the thread pool
+    store_names = sorted(db_file.stem for db_file in stores_dir.glob("*.db"))
+    return list(
+        await asyncio.gather(
+            *(asyncio.to_thread(get_store_summary, name) for name in store_names)
+        )
+    )
 
-        # Get finding count and date range
-        try:
-            with sqlite3.connect(db_file) as conn:
-                cursor = conn.execute("SELECT COUNT(*) FROM embeddings")
-                count = cursor.fetchone()[0]
-
-                cursor = conn.execute(
-                    "SELECT MIN(created_at), MAX(created_at) FROM embeddings"
-                )
-                row = cursor.fetchone()
-                min_ts, max_ts = row[0], row[1]
-
-                created = datetime.fromtimestamp(min_ts).strftime("%Y-%m-%d %H:%M") if min_ts else "N/A"
-                updated = datetime.fromtimestamp(max_ts).strftime("%Y-%m-%d %H:%M") if max_ts else "N/A"
-        except Exception:
-            count = 0
-            created = "N/A"
-            updated = "N/A"
-
-        stores.append({
-            "name": store_name,
-            "finding_count": count,
-            "created": created,
-            "updated": updated,
-        })
 
-    # Sort by name
-    stores.sort(key=lambda s: s["name"])
-    return stores
+# Loaded HNSW indices, keyed by store name -> (index file mtime, index)
+_INDEX_CACHE: dict[str, tuple[float, hnswlib.Index]] = {}
+_INDEX_LOCK = threading.Lock()
+
+
+def get_index(store_name: str) -> hnswlib.Index | None:
+    """
+    Get the HNSW index for a store, loading it from disk only when needed.
+
+    The loaded index is cached and reused across requests until the index
+    file's mtime changes (e.g. a research session wrote new findings).
+    """
+    index_path = get_stores_dir() / f"{store_name}.index"
+    try:
+        mtime = index_path.stat().st_mtime
+    except FileNotFoundError:
+        return None
+
+    with _INDEX_LOCK:
+        cached = _INDEX_CACHE.get(store_name)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        # Stored and query vectors are unit-norm, so ip distance == cosine distance
+        index = hnswlib.Index(space="ip", dim=Config.EMBEDDING_DIM)
+        index.load_index(str(index_path))
+        index.set_ef(Config.HNSW_EF_SEARCH)
+        _INDEX_CACHE[store_name] = (mtime, index)
+        return index
+
+
+# Long-lived SQLite connections, keyed by database path
+_CONN_CACHE: dict[Path, sqlite3.Connection] = {}
+_CONN_LOCK = threading.Lock()
 
 
 def get_store_connection(store_name: str) -> sqlite3.Connection:
-    """Get a connection to a store's SQLite database."""
+    """
+    Get the shared connection to a store's SQLite database.
+
+    Each store gets one long-lived connection (opened on first use) so that
+    SQLite's page cache stays warm across requests. Because the connection is
+    reused, its prepared-statement cache also persists: the routes' fixed
+    parameterized queries are compiled once per store rather than per request.
+    """
     db_path = get_stores_dir() / f"{store_name}.db"
     if not db_path.exists():
         raise HTTPException(status_code=404, detail=f"Store '{store_name}' not found")
-    return sqlite3.connect(db_path)
+
+    with _CONN_LOCK:
+        conn = _CONN_CACHE.get(db_path)
+        if conn is None:
+            # Read-only: the explorer never writes, and must not change a store
+            # the agent may be writing to. Room for the fixed queries plus one
+            # IN (...) statement per result size.
+            conn = sqlite3.connect(
+                f"{db_path.resolve().as_uri()}?mode=ro",
+                uri=True,
+                check_same_thread=False,
+                cached_statements=256,
+            )
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-64000")  # ~64MB
+            _CONN_CACHE[db_path] = conn
+        return conn
+
+
+def close_store_connections() -> None:
+    """Close all cached store connections."""
+    with _CONN_LOCK:
+        for conn in _CONN_CACHE.values():
+            conn.close()
+        _CONN_CACHE.clear()
 
 
 def get_findings(store_name: str, offset: int = 0, limit: int = 50) -> list[dict]:
     """Get findings from a store with pagination."""
-    with get_store_connection(store_name) as conn:
-        cursor = conn.execute(
-            """
-            SELECT id, doc_id, text, metadata, created_at
-            FROM embeddings
-            ORDER BY created_at DESC
-            LIMIT ? OFFSET ?
-            """,
-            (limit, offset),
-        )
+    conn = get_store_connection(store_name)
+    cursor = conn.execute(
+        """
+        SELECT id, doc_id, substr(text, 1, 201), metadata, created_at
+        FROM embeddings
+        ORDER BY created_at DESC
+        LIMIT ? OFFSET ?
+        """,
+        (limit, offset),
+    )
 
-        findings = []
-        for row in cursor.fetchall():
-            metadata = json.loads(row[3]) if row[3] else {}
-            findings.append({
-                "row_id": row[0],
-                "doc_id": row[1],
-                "text": row[2],
-                "text_preview": row[2][:200] + "..." if len(row[2]) > 200 else row[2],
-                "metadata": metadata,
-                "finding_type": metadata.get("finding_type", "unknown"),
-                "source_url": metadata.get("source_url", ""),
-                "title": metadata.get("title", "Untitled"),
-                "created_at": datetime.fromtimestamp(row[4]).strftime("%Y-%m-%d %H:%M") if row[4] else "N/A",
-            })
+    findings = []
+    for row in cursor:
+        metadata = orjson.loads(row[3]) if row[3] else {}
+        findings.append({
+            "row_id": row[0],
+            "doc_id": row[1],
+            "text_preview": row[2][:200] + "..." if len(row[2]) > 200 else row[2],
+            "metadata": metadata,
+            "finding_type": metadata.get("finding_type", "unknown"),
+            "source_url": metadata.get("source_url", ""),
+            "title": metadata.get("title", "Untitled"),
+            "created_at": datetime.fromtimestamp(row[4]).strftime("%Y-%m-%d %H:%M") if row[4] else "N/A",
+        })
 
-        return findings
+    return findings
 
 
 def get_finding_count(store_name: str) -> int:
     """Get total finding count for a store."""
-    with get_store_connection(store_name) as conn:
-        cursor = conn.execute("SELECT COUNT(*) FROM embeddings")
-        return cursor.fetchone()[0]
+    conn = get_store_connection(store_name)
+    cursor = conn.execute("SELECT COUNT(*) FROM embeddings")
+    return cursor.fetchone()[0]
 
 
 def get_unique_sources(store_name: str) -> list[dict]:
     """Get unique sources from a store with finding counts."""
-    with get_store_connection(store_name) as conn:
-        cursor = conn.execute("SELECT metadata FROM embeddings")
-
-        sources = {}  # url -> {title, count}
-        for row in cursor.fetchall():
-            metadata = json.loads(row[0]) if row[0] else {}
-            url = metadata.get("source_url", "")
-            title = metadata.get("title", "Untitled")
-
-            if url:
-                if url not in sources:
-                    sources[url] = {"url": url, "title": title, "count": 0}
-                sources[url]["count"] += 1
-
-        # Sort by count descending
-        source_list = list(sources.values())
-        source_list.sort(key=lambda x: -x["count"])
-        return source_list
+    conn = get_store_connection(store_name)
+
+    # Aggregate in SQLite rather than parsing every metadata blob in Python.
+    # The title comes from each source's first finding (the MIN(id) row), and
+    # ties are broken by first appearance.
+    cursor = conn.execute(
+        """
+        SELECT
+            json_extract(metadata, '$.source_url') AS url,
+            COALESCE(json_extract(metadata, '$.title'), 'Untitled') AS title,
+            COUNT(*) AS count,
+            MIN(id) AS first_id
+        FROM embeddings
+        WHERE url IS NOT NULL AND url != ''
+        GROUP BY url
+        ORDER BY count DESC, first_id
+        """
+    )
+    return [
+        {"url": row[0], "title": row[1], "count": row[2]}
+        for row in cursor
+    ]
 
 
 def get_finding_by_id(store_name: str, doc_id: str) -> dict | None:
     """Get a single finding by doc_id."""
-    with get_store_connection(store_name) as conn:
-        cursor = conn.execute(
-            "SELECT id, doc_id, text, metadata, created_at FROM embeddings WHERE doc_id = ?",
-            (doc_id,),
-        )
-        row = cursor.fetchone()
-        if not row:
-            return None
-
-        metadata = json.loads(row[3]) if row[3] else {}
-        return {
-            "row_id": row[0],
-            "doc_id": row[1],
-            "text": row[2],
-            "metadata": metadata,
-            "finding_type": metadata.get("finding_type", "unknown"),
-            "source_url": metadata.get("source_url", ""),
-            "title": metadata.get("title", "Untitled"),
-            "author": metadata.get("author"),
-            "publication_date": metadata.get("publication_date"),
-            "accessed_date": metadata.get("accessed_date"),
-            "relevance_notes": metadata.get("relevance_notes", ""),
-            "created_at": datetime.fromtimestamp(row[4]).strftime("%Y-%m-%d %H:%M") if row[4] else "N/A",
-        }
+    conn = get_store_connection(store_name)
+    cursor = conn.execute(
+        "SELECT id, doc_id, text, metadata, created_at FROM embeddings WHERE doc_id = ?",
+        (doc_id,),
+    )
+    row = cursor.fetchone()
+    if not row:
+        return None
+
+    metadata = orjson.loads(row[3]) if row[3] else {}
+    return {
+        "row_id": row[0],
+        "doc_id": row[1],
+        "text": row[2],
+        "metadata": metadata,
+        "finding_type": metadata.get("finding_type", "unknown"),
+        "source_url": metadata.get("source_url", ""),
+        "title": metadata.get("title", "Untitled"),
+        "author": metadata.get("author"),
+        "publication_date": metadata.get("publication_date"),
+        "accessed_date": metadata.get("accessed_date"),
+        "relevance_notes": metadata.get("relevance_notes", ""),
+        "created_at": datetime.fromtimestamp(row[4]).strftime("%Y-%m-%d %H:%M") if row[4] else "N/A",
+    }
+
+
+def fetch_rows_by_id(
+    conn: sqlite3.Connection, row_ids: list[int], preview_chars: int
+) -> dict[int, tuple]:
+    """
+    Fetch (doc_id, text prefix, metadata, created_at) rows for index labels in one query.
+
+    Only the first `preview_chars` characters of each text are read, which is
+    enough for callers to build a preview and tell whether it was truncated.
+
+    Returns a mapping of row id -> row so callers can walk the labels in the
+    order hnswlib returned them. Ids with no row (deleted findings) are absent.
+    """
+    if not row_ids:
+        return {}
+
+    placeholders = ",".join("?" * len(row_ids))
+    cursor = conn.execute(
+        f"SELECT id, doc_id, substr(text, 1, ?), metadata, created_at FROM embeddings WHERE id IN ({placeholders})",
+        [preview_chars, *row_ids],
+    )
+    return {row[0]: row[1:] for row in cursor}
 
 
 def get_neighbors(store_name: str, doc_id: str, k: int = 10) -> list[dict]:
     """Get nearest neighbor findings for a given finding."""
-    stores_dir = get_stores_dir()
-    index_path = stores_dir / f"{store_name}.index"
-
-    if not index_path.exists():
+    index = get_index(store_name)
+    if index is None:
         return []
 
     # Get the row_id for this doc_id
-    with get_store_connection(store_name) as conn:
-        cursor = conn.execute(
-            "SELECT id FROM embeddings WHERE doc_id = ?",
-            (doc_id,),
-        )
-        row = cursor.fetchone()
-        if not row:
-            return []
-        row_id = row[0]
+    conn = get_store_connection(store_name)
+    cursor = conn.execute(
+        "SELECT id FROM embeddings WHERE doc_id = ?",
+        (doc_id,),
+    )
+    row = cursor.fetchone()
+    if not row:
+        return []
+    row_id = row[0]
 
-        # Get total count for dimension detection
-        cursor = conn.execute("SELECT COUNT(*) FROM embeddings")
-        total_count = cursor.fetchone()[0]
+    # The index knows its size; no need to COUNT(*) the table
+    total_count = index.get_current_count()
 
     if total_count <= 1:
         return []
 
-    # Load index and get the vector
-    # We need to determine the dimension - read from config
-    dimension = Config.EMBEDDING_DIM
-
-    index = hnswlib.Index(space="cosine", dim=dimension)
-    index.load_index(str(index_path))
-
     # Get the vector for this item
     try:
-        vectors = index.get_items([row_id])
-        if len(vectors) == 0:
+        # Already a (1, dim) float32 array, usable as the query as-is
+        query_vectors = index.get_items([row_id])
+        if len(query_vectors) == 0:
             return []
-        query_vector = vectors[0]
     except Exception:
         return []
 
     # Search for k+1 neighbors (includes self)
     search_k = min(k + 1, total_count)
-    labels, distances = index.knn_query(np.array([query_vector], dtype=np.float32), k=search_k)
+    labels, distances = index.knn_query(query_vectors, k=search_k)
+
+    # Get the findings, excluding self, in distance order
+    neighbor_ids = [int(label) for label in labels[0] if label != row_id]
+    rows_by_id = fetch_rows_by_id(conn, neighbor_ids, preview_chars=151)
 
-    # Get the findings, excluding self
     neighbor_findings = []
-    with get_store_connection(store_name) as conn:
-        for label, distance in zip(labels[0], distances[0]):
-            if label == row_id:
-                continue  # Skip self
-
-            cursor = conn.execute(
-                "SELECT doc_id, text, metadata, created_at FROM embeddings WHERE id = ?",
-                (int(label),),
-            )
-            row = cursor.fetchone()
-            if row:
-                metadata = json.loads(row[2]) if row[2] else {}
-                neighbor_findings.append({
-                    "doc_id": row[0],
-                    "text_preview": row[1][:150] + "..." if len(row[1]) > 150 else row[1],
-                    "title": metadata.get("title", "Untitled"),
-                    "finding_type": metadata.get("finding_type", "unknown"),
-                    "distance": round(float(distance), 4),
-                })
-
-            if len(neighbor_findings) >= k:
-                break
-
-    # Sort by distance (closest/most similar first)
-    neighbor_findings.sort(key=lambda x: -x["distance"])
+    for label, distance in zip(labels[0], distances[0]):
+        row = rows_by_id.get(int(label))
+        if row:
+            metadata = orjson.loads(row[2]) if row[2] else {}
+            neighbor_findings.append({
+                "doc_id": row[0],
+                "text_preview": row[1][:150] + "..." if len(row[1]) > 150 else row[1],
+                "title": metadata.get("title", "Untitled"),
+                "finding_type": metadata.get("finding_type", "unknown"),
+                "distance": round(float(distance), 4),
+            })
+
+        if len(neighbor_findings) >= k:
+            break
+
+    # hnswlib returns neighbors by ascending distance (most similar first)
     return neighbor_findings
 
 
 def search_store(store_name: str, query: str, k: int = 10) -> list[dict]:
     """Semantic search across findings in a store."""
-    stores_dir = get_stores_dir()
-    index_path = stores_dir / f"{store_name}.index"
-
-    if not index_path.exists():
+    index = get_index(store_name)
+    if index is None:
         return []
 
-    # Get total count
-    with get_store_connection(store_name) as conn:
-        cursor = conn.execute("SELECT COUNT(*) FROM embeddings")
-        total_count = cursor.fetchone()[0]
+    # The index knows its size; no need to COUNT(*) the table
+    total_count = index.get_current_count()
 
     if total_count == 0:
         return []
 
     # Embed the query
-    embedder = get_embedder()
-    query_vector = embedder.embed_single(query, is_query=True)
-
-    # Load index and search
-    dimension = Config.EMBEDDING_DIM
-    index = hnswlib.Index(space="cosine", dim=dimension)
-    index.load_index(str(index_path))
+    query_vector = get_embedder().embed_single(query, is_query=True)
 
+    # Search the cached index
     search_k = min(k, total_count)
-    labels, distances = index.knn_query(np.array([query_vector], dtype=np.float32), k=search_k)
+    labels, distances = index.knn_query(query_vector[np.newaxis, :], k=search_k)
+
+    # Get the findings in distance order
+    conn = get_store_connection(store_name)
+    rows_by_id = fetch_rows_by_id(conn, [int(label) for label in labels[0]], preview_chars=201)
 
-    # Get the findings
     results = []
-    with get_store_connection(store_name) as conn:
-        for label, distance in zip(labels[0], distances[0]):
-            cursor = conn.execute(
-                "SELECT doc_id, text, metadata, created_at FROM embeddings WHERE id = ?",
-                (int(label),),
-            )
-            row = cursor.fetchone()
-            if row:
-                metadata = json.loads(row[2]) if row[2] else {}
-                results.append({
-                    "doc_id": row[0],
-                    "text_preview": row[1][:200] + "..." if len(row[1]) > 200 else row[1],
-                    "title": metadata.get("title", "Untitled"),
-                    "finding_type": metadata.get("finding_type", "unknown"),
-                    "source_url": metadata.get("source_url", ""),
-                    "distance": round(float(distance), 4),
-                })
-
-    # Sort by distance (most similar first)
-    results.sort(key=lambda x: -x["distance"])
+    for label, distance in zip(labels[0], distances[0]):
+        row = rows_by_id.get(int(label))
+        if row:
+            metadata = orjson.loads(row[2]) if row[2] else {}
+            results.append({
+                "doc_id": row[0],
+                "text_preview": row[1][:200] + "..." if len(row[1]) > 200 else row[1],
+                "title": metadata.get("title", "Untitled"),
+                "finding_type": metadata.get("finding_type", "unknown"),
+                "source_url": metadata.get("source_url", ""),
+                "distance": round(float(distance), 4),
+            })
+
+    # hnswlib returns results by ascending distance (most similar first)
     return results
 
 
+# --- HTTP caching ---
+
+# Short client-side freshness; revalidation with the ETag is cheap after that
+CACHE_CONTROL = "private, max-age=5"
+
+
+def store_etag(store_name: str, *parts: object) -> str:
+    """
+    Build a weak ETag for a store page from the store's file mtimes.
+
+    The WAL file is included because committed writes land there before a
+    checkpoint touches the main database, and the index file because
+    neighbor results depend on it. `parts` distinguishes pages of one route.
+    """
+    # Open the connection first so WAL files it creates don't change the
+    # stamps after the first response; 404s unknown stores
+    get_store_connection(store_name)
+
+    stores_dir = get_stores_dir()
+    stamps = []
+    for suffix in (".db", ".db-wal", ".index"):
+        try:
+            stamps.append(str((stores_dir / f"{store_name}{suffix}").stat().st_mtime_ns))
+        except FileNotFoundError:
+            stamps.append("0")
+    return 'W/"' + "-".join([*stamps, *(str(part) for part in parts)]) + '"'
+
+
+def not_modified(request: Request, etag: str) -> Response | None:
+    """Return a 304 response if the client already has this version."""
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
+    return None
+
+
+def with_cache_headers(response: Response, etag: str) -> Response:
+    """Attach the ETag and Cache-Control headers to a rendered page."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    return response
+
+
 # --- Routes ---
 
 @app.get("/", response_class=HTMLResponse)
 async def index(request: Request):
     """Home page - list all stores."""
-    stores = list_stores()
+    stores = await list_stores()
     return templates.TemplateResponse(
         "index.html",
         {"request": request, "stores": stores},
@@ -338,12 +485,19 @@ async def store_detail(request: Request, store_name: str, page: int = 1):
     limit = 50
     offset = (page - 1) * limit
 
-    findings = get_findings(store_name, offset=offset, limit=limit)
-    total_count = get_finding_count(store_name)
+    etag = store_etag(store_name, page, limit)
+    if (cached := not_modified(request, etag)) is not None:
+        return cached
+
+    # The three queries are independent; overlap them in the thread pool
+    findings, total_count, sources = await asyncio.gather(
+        asyncio.to_thread(get_findings, store_name, offset=offset, limit=limit),
+        asyncio.to_thread(get_finding_count, store_name),
+        asyncio.to_thread(get_unique_sources, store_name),
+    )
     total_pages = (total_count + limit - 1) // limit
-    sources = get_unique_sources(store_name)
 
-    return templates.TemplateResponse(
+    response = templates.TemplateResponse(
         "store.html",
         {
             "request": request,
@@ -355,16 +509,21 @@ async def store_detail(request: Request, store_name: str, page: int = 1):
             "sources": sources,
         },
     )
+    return with_cache_headers(response, etag)
 
 
 @app.get("/stores/{store_name}/findings/{doc_id}", response_class=HTMLResponse)
 async def finding_detail(request: Request, store_name: str, doc_id: str):
     """Finding detail page."""
+    etag = store_etag(store_name, doc_id)
+    if (cached := not_modified(request, etag)) is not None:
+        return cached
+
     finding = get_finding_by_id(store_name, doc_id)
     if not finding:
         raise HTTPException(status_code=404, detail="Finding not found")
 
-    return templates.TemplateResponse(
+    response = templates.TemplateResponse(
         "finding.html",
         {
             "request": request,
@@ -372,13 +531,18 @@ async def finding_detail(request: Request, store_name: str, doc_id: str):
             "finding": finding,
         },
     )
+    return with_cache_headers(response, etag)
 
 
 @app.get("/stores/{store_name}/findings/{doc_id}/neighbors", response_class=HTMLResponse)
 async def finding_neighbors(request: Request, store_name: str, doc_id: str, k: int = 10):
     """Get neighbors partial (for htmx)."""
+    etag = store_etag(store_name, doc_id, k)
+    if (cached := not_modified(request, etag)) is not None:
+        return cached
+
     neighbors = get_neighbors(store_name, doc_id, k=k)
-    return templates.TemplateResponse(
+    response = templates.TemplateResponse(
         "partials/neighbors.html",
         {
             "request": request,
@@ -386,6 +550,7 @@ async def finding_neighbors(request: Request, store_name: str, doc_id: str, k: i
             "neighbors": neighbors,
         },
     )
+    return with_cache_headers(response, etag)
 
 
 @app.get("/stores/{store_name}/search", response_class=HTMLResponse)
@@ -394,7 +559,8 @@ async def store_search(request: Request, store_name: str, q: str = "", k: int =
     if not q.strip():
         return HTMLResponse("<p><em>Enter a search query above.</em></p>")
 
-    results = search_store(store_name, q, k=k)
+    await wait_for_embedder(request.app)
+    results = await asyncio.to_thread(search_store, store_name, q, k=k)
     return templates.TemplateResponse(
         "partials/search_results.html",
         {
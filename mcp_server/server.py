@@ -6,11 +6,12 @@ from pathlib import Path
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+import numpy as np
 from mcp.server.fastmcp import FastMCP
 
 from research_agent.config import Config
 from research_agent.embeddings.qwen_embedder import QwenEmbedder
-from research_agent.storage import Collection
+from research_agent.storage import Collection, SearchResult
 
 
 # Create MCP server
@@ -35,6 +36,22 @@ def get_embedder() -> QwenEmbedder:
     return _embedder
 
 
+def format_search_result(result: SearchResult) -> dict:
+    """Format a search result with its citation for MCP clients."""
+    metadata = result.metadata or {}
+    return {
+        "text": result.text,
+        "source_url": metadata.get("source_url", ""),
+        "title": metadata.get("title", ""),
+        "author": metadata.get("author"),
+        "publication_date": metadata.get("publication_date"),
+        "accessed_date": metadata.get("accessed_date"),
+        "relevance_notes": metadata.get("relevance_notes", ""),
+        "distance": round(result.distance, 4),
+        "relevance_score": round(1 - result.distance, 4),  # Higher = more relevant
+    }
+
+
 @mcp.tool()
 def list_knowledge_stores() -> list[dict]:
     """
@@ -107,37 +124,79 @@ def query_knowledge_store(
     k = max(1, min(k, 50))
 
     try:
-        # Get embedder and generate query embedding
-        embedder = get_embedder()
-        query_embedding = embedder.embed_single(query, is_query=True)
+        # Generate (or reuse) the query embedding
+        query_embedding = get_embedder().embed_single(query, is_query=True)
 
         # Initialize collection
         collection = Collection(
             name=store_name,
-            dimension=embedder.dimension,
+            dimension=get_embedder().dimension,
             path=store_dir,
+            ef_search=Config.HNSW_EF_SEARCH,
         )
 
         # Search
         results = collection.search(query_embedding, k=k)
 
-        # Format results
-        formatted_results = []
-        for result in results:
-            metadata = result.metadata or {}
-            formatted_results.append({
-                "text": result.text,
-                "source_url": metadata.get("source_url", ""),
-                "title": metadata.get("title", ""),
-                "author": metadata.get("author"),
-                "publication_date": metadata.get("publication_date"),
-                "accessed_date": metadata.get("accessed_date"),
-                "relevance_notes": metadata.get("relevance_notes", ""),
-                "distance": round(result.distance, 4),
-                "relevance_score": round(1 - result.distance, 4),  # Higher = more relevant
-            })
+        return [format_search_result(result) for result in results]
+
+    except Exception as e:
+        return {"error": f"Error querying store: {str(e)}"}
+
+
+@mcp.tool()
+def query_knowledge_stores_batch(
+    store_name: str,
+    queries: list[str],
+    k: int = 10,
+) -> list[list[dict]] | dict:
+    """
+    Run several semantic searches against one knowledge store in a single call.
+
+    Prefer this over repeated query_knowledge_store calls when you have several
+    questions for the same store: all queries are embedded and searched together.
+
+    Args:
+        store_name: Name of the knowledge store (without .db extension).
+                   Use list_knowledge_stores() to see available stores.
+        queries: Natural language search queries.
+        k: Number of results to return per query (default: 10, max: 50)
+
+    Returns:
+        One list of findings per query, in the same order as `queries`.
+        Lower distance = more relevant.
+    """
+    store_dir = Config.KNOWLEDGE_STORE_DIR
+    db_path = store_dir / f"{store_name}.db"
+
+    if not db_path.exists():
+        return {"error": f"Knowledge store '{store_name}' not found. Use list_knowledge_stores() to see available stores."}
+
+    if not queries:
+        return []
+
+    # Clamp k to reasonable range
+    k = max(1, min(k, 50))
+
+    try:
+        # Embed all queries in one forward pass
+        embedder = get_embedder()
+        query_embeddings = embedder.embed(queries, is_query=True)
+
+        collection = Collection(
+            name=store_name,
+            dimension=embedder.dimension,
+            path=store_dir,
+            ef_search=Config.HNSW_EF_SEARCH,
+        )
+
+        # One knn_query and one SQLite fetch for the whole batch
+        batch_results = collection.search_batch(query_embeddings, k=k)
 
-        return formatted_results
+        return [
+            [format_search_result(result) for result in results]
+            for results in batch_results
+        ]
 
     except Exception as e:
         return {"error": f"Error querying store: {str(e)}"}
@@ -169,19 +228,14 @@ def get_store_statistics(store_name: str) -> dict:
 
         count = collection.count()
 
-        # Get all embeddings to extract unique sources
-        source_urls = set()
-        if count > 0:
-            embeddings = collection.get_all(limit=count)
-            for emb in embeddings:
-                if emb.metadata and "source_url" in emb.metadata:
-                    source_urls.add(emb.metadata["source_url"])
+        # Aggregate unique sources in SQLite rather than loading every row
+        source_urls = collection.unique_source_urls()
 
         return {
             "store_name": store_name,
             "total_findings": count,
             "unique_sources": len(source_urls),
-            "source_urls": list(source_urls),
+            "source_urls": source_urls,
         }
 
     except Exception as e:
@@ -1,12 +1,13 @@
 """Main research agent loop with Claude tool use."""
 
 import asyncio
-import json
-from typing import Any
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
 
-import anthropic
-from rich.console import Console
+import orjson
+from rich.console import Console, Group, RenderableType
 from rich.panel import Panel
+from rich.text import Text
 
 from research_agent.agent.system_prompt import build_system_prompt
 from research_agent.agent.tools_schema import TOOLS
@@ -14,37 +15,105 @@ from research_agent.config import Config
 from research_agent.initial_research.wikipedia import WikipediaContext
 from research_agent.models.brief import ResearchBrief
 from research_agent.planner.query_generator import ResearchPlan
-from research_agent.tools.browser import BrowserTool
+from research_agent.storage.tool_cache import ToolResultCache
+from research_agent.tools.browser import SearchResult
 from research_agent.tools.finding_queue import FindingQueue, StorageTask
-from research_agent.tools.memory import MemoryTool
 from research_agent.tools.quote_validator import validate_direct_quote
 
+if TYPE_CHECKING:
+    from research_agent.tools.browser import BrowserTool
+    from research_agent.tools.memory import MemoryTool
+
 console = Console()
 
+# Tools whose result depends only on their input for the length of a run.
+# search_findings is excluded: its results change as findings are stored.
+CACHEABLE_TOOLS = frozenset({"web_search", "get_page_content"})
+TOOL_CACHE_SIZE = 256
+
+# How long results of cacheable tools are reused across runs, in seconds
+PERSISTED_TOOL_TTLS = {
+    "web_search": 6 * 60 * 60,
+    "get_page_content": 24 * 60 * 60,
+}
+
+# Extended thinking budget. Early turns mostly dispatch the planned queries and
+# need little reasoning; it grows with the findings there are to reason about.
+THINKING_BUDGET_MIN = 2000
+THINKING_BUDGET_MAX = 10000
+THINKING_TOKENS_PER_FINDING = 200
+RESPONSE_TOKENS = 6000  # Room for text and tool calls on top of thinking
+
+# Tools that drive the browser; these share Config.MAX_CONCURRENT_TOOLS slots.
+# Memory tools are cheap and run unbounded.
+BROWSER_TOOLS = frozenset({"web_search", "get_page_content"})
+
+# Tool output older than the most recent messages is elided from the transcript
+# so that long runs don't resend every page they have read on every turn.
+KEEP_RECENT_MESSAGES = 20
+ELIDED_FIELD_CHARS = 500
+ELIDED_MARKER = "[truncated: use search_findings to recall]"
+
+
+def is_reusable_result(result: Any) -> bool:
+    """Whether a browser tool result succeeded and is worth reusing."""
+    if isinstance(result, dict):
+        return "error" not in result
+    # An empty search result usually means the search failed or was blocked
+    return bool(result)
+
+
+def elide_long_fields(value: Any) -> Any:
+    """Replace long text/snippet fields in a decoded tool result with a marker."""
+    if isinstance(value, list):
+        return [elide_long_fields(item) for item in value]
+    if isinstance(value, dict):
+        return {
+            key: (
+                ELIDED_MARKER
+                if key in ("text", "snippet") and isinstance(item, str) and len(item) > ELIDED_FIELD_CHARS
+                else elide_long_fields(item)
+            )
+            for key, item in value.items()
+        }
+    return value
+
 
 class ResearchAgent:
     """Main research agent with tool-use loop."""
 
     def __init__(
         self,
-        browser_tool: BrowserTool,
-        memory_tool: MemoryTool,
+        browser_tool: "BrowserTool",
+        memory_tool: "MemoryTool",
         model: str | None = None,
         verbose: bool = False,
         thinking: bool = True,
     ):
-        self._client = anthropic.Anthropic(api_key=Config.ANTHROPIC_API_KEY)
+        # Imported here: the SDK takes about a second to import, which the CLI
+        # shouldn't pay for --help or a configuration error
+        import anthropic
+
+        self._client = anthropic.AsyncAnthropic(api_key=Config.ANTHROPIC_API_KEY)
         self._browser = browser_tool
         self._memory = memory_tool
-        self._finding_queue = FindingQueue(memory_tool)
+        self._finding_queue = FindingQueue(memory_tool, num_workers=Config.FINDING_WORKERS)
         self._model = model or Config.CLAUDE_MODEL
         self._messages: list[dict] = []
         self._turn_count = 0
         self._verbose = verbose
+        # Panels only pay off on a real terminal; piped output gets plain text
+        self._fancy_output = console.is_terminal
         self._thinking = thinking
         self._total_input_tokens = 0
         self._total_output_tokens = 0
+        self._total_cached_input_tokens = 0
         self._shutdown_requested = False
+        # (tool name, canonical input) -> task, so concurrent duplicates share one call
+        self._tool_cache: OrderedDict[tuple[str, bytes], asyncio.Future] = OrderedDict()
+        self._persisted_cache = ToolResultCache(Config.TOOL_CACHE_DIR)
+        self._browser_semaphore = asyncio.Semaphore(Config.MAX_CONCURRENT_TOOLS)
+        self._trimmed_upto = 0  # Messages before this index have been elided
 
     def request_shutdown(self) -> None:
         """Request graceful shutdown of the agent."""
@@ -52,23 +121,81 @@ class ResearchAgent:
         console.print("\n[yellow]Shutdown requested. Finishing current operation...[/yellow]")
 
     async def _execute_tool(self, tool_name: str, tool_input: dict) -> Any:
+        """Execute a tool, reusing the result of an identical earlier call when safe."""
+        if tool_name not in CACHEABLE_TOOLS:
+            return await self._run_tool_bounded(tool_name, tool_input)
+
+        key = (tool_name, orjson.dumps(tool_input, option=orjson.OPT_SORT_KEYS))
+        task = self._tool_cache.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._run_tool_persisted(tool_name, tool_input))
+            self._tool_cache[key] = task
+            if len(self._tool_cache) > TOOL_CACHE_SIZE:
+                self._tool_cache.popitem(last=False)
+        else:
+            self._tool_cache.move_to_end(key)
+
+        # Shield so one cancelled caller doesn't cancel the call for the others
+        result = await asyncio.shield(task)
+
+        # Don't keep failures; the next identical call should retry
+        if not is_reusable_result(result) and self._tool_cache.get(key) is task:
+            del self._tool_cache[key]
+
+        return result
+
+    async def _run_tool_persisted(self, tool_name: str, tool_input: dict) -> Any:
+        """Execute a tool, reusing a result saved by this or an earlier run."""
+        # The cache only saves work; if it fails, run the tool as if uncached
+        try:
+            result = await asyncio.to_thread(self._persisted_cache.get, tool_name, tool_input)
+            if result is not None and tool_name == "web_search":
+                # Stored as JSON; return the same type as a fresh search
+                result = [SearchResult(**item) for item in result]
+        except Exception as e:
+            console.print(f"    [yellow]Tool cache read failed: {e}[/yellow]")
+            result = None
+        if result is not None:
+            return result
+
+        result = await self._run_tool_bounded(tool_name, tool_input)
+        if is_reusable_result(result):
+            try:
+                await asyncio.to_thread(
+                    self._persisted_cache.set,
+                    tool_name,
+                    tool_input,
+                    result,
+                    PERSISTED_TOOL_TTLS[tool_name],
+                )
+            except Exception as e:
+                console.print(f"    [yellow]Tool cache write failed: {e}[/yellow]")
+        return result
+
+    async def _run_tool_bounded(self, tool_name: str, tool_input: dict) -> Any:
+        """Execute a tool, limiting how many browser tools run at once."""
+        if tool_name in BROWSER_TOOLS:
+            async with self._browser_semaphore:
+                return await self._run_tool(tool_name, tool_input)
+        return await self._run_tool(tool_name, tool_input)
+
+    async def _run_tool(self, tool_name: str, tool_input: dict) -> Any:
         """Execute a tool and return the result."""
         try:
             if tool_name == "web_search":
-                results = await self._browser.web_search(
+                # orjson serializes the SearchResult dataclasses directly
+                return await self._browser.web_search(
                     query=tool_input["query"],
                     num_results=tool_input.get("num_results", 10),
                 )
-                return [
-                    {"title": r.title, "url": r.url, "snippet": r.snippet}
-                    for r in results
-                ]
 
             elif tool_name == "get_page_content":
                 content = await self._browser.get_page_content(
                     url=tool_input["url"],
                     wait_for_js=tool_input.get("wait_for_js", True),
                 )
+                if content.error:
+                    return {"error": f"Failed to load page: {content.error}"}
                 return {
                     "title": content.title,
                     "url": content.url,
@@ -116,7 +243,10 @@ class ResearchAgent:
                 return {"status": "queued", "finding_type": finding_type}
 
             elif tool_name == "search_findings":
-                results = self._memory.search_findings(
+                # Embedding the query is blocking model work; keep it off the
+                # event loop so browser tools keep running meanwhile
+                results = await asyncio.to_thread(
+                    self._memory.search_findings,
                     query=tool_input["query"],
                     k=tool_input.get("k", 10),
                 )
@@ -126,9 +256,10 @@ class ResearchAgent:
                         "finding_type": f.finding_type,
                         "source": f.citation.source_url,
                         "title": f.citation.title,
-                        "distance": round(score, 4),
+                        "distance": round(distance, 4) if distance is not None else None,
+                        "match_type": match_type,
                     }
-                    for f, score in results
+                    for f, distance, match_type in results
                 ]
 
             elif tool_name == "get_memory_stats":
@@ -140,12 +271,84 @@ class ResearchAgent:
         except Exception as e:
             return {"error": str(e)}
 
+    async def _execute_block(self, block: Any) -> tuple[Any, Any]:
+        """Execute a tool_use block, returning it alongside its result."""
+        result = await self._execute_tool(block.name, block.input)
+        return block, result
+
+    def _render_block(self, content: str, title: str, style: str) -> RenderableType:
+        """Render a titled block as a Panel on a terminal, or plain text otherwise."""
+        if self._fancy_output:
+            return Panel(content, title=f"[{style}]{title}[/{style}]", border_style="dim")
+        return Text(f"{title}:\n{content}")
+
+    def _log_tool_call(self, block: Any) -> None:
+        """Print a tool call and the input most useful for following along."""
+        console.print(
+            f"  [cyan]Tool:[/cyan] {block.name}",
+            highlight=False,
+        )
+        # Log tool input for debugging
+        if block.name == "web_search":
+            console.print(
+                f"    [dim]Query: {block.input.get('query', '')}[/dim]"
+            )
+        elif block.name == "get_page_content":
+            url = block.input.get("url", "")
+            console.print(f"    [dim]URL: {url[:80]}...[/dim]" if len(url) > 80 else f"    [dim]URL: {url}[/dim]")
+        elif block.name == "store_finding":
+            finding_type = block.input.get("finding_type", "paraphrase")
+            text = block.input.get("text", "")[:80]
+            console.print(f"    [dim][{finding_type}] {text}...[/dim]")
+
+    def _log_tool_result(self, block: Any, result: Any) -> None:
+        """Print a one-line summary of a finished tool call."""
+        if block.name == "web_search" and isinstance(result, list):
+            console.print(f"  [green]{block.name}: Found {len(result)} results[/green]")
+        elif block.name == "store_finding":
+            if isinstance(result, dict) and result.get("status") == "error":
+                console.print(f"  [red]{block.name}: {result.get('error', 'Error')}[/red]")
+            else:
+                console.print(f"  [green]{block.name}: Queued[/green]")
+        elif block.name == "get_page_content":
+            console.print(f"  [green]{block.name}: Done[/green]")
+        elif block.name == "get_memory_stats" and isinstance(result, dict):
+            console.print(
+                f"  [green]{block.name}: Findings: {result.get('total_findings', 0)}, Sources: {result.get('unique_sources', 0)}[/green]"
+            )
+
+    def _trim_history(self) -> None:
+        """Elide bulky tool output from all but the most recent messages."""
+        cutoff = len(self._messages) - KEEP_RECENT_MESSAGES
+        for message in self._messages[self._trimmed_upto:max(cutoff, 0)]:
+            if message["role"] != "user" or not isinstance(message["content"], list):
+                continue
+            for block in message["content"]:
+                if block.get("type") == "tool_result":
+                    # tool_use ids are untouched, only the result payload shrinks
+                    result = orjson.loads(block["content"])
+                    block["content"] = orjson.dumps(elide_long_fields(result)).decode()
+        self._trimmed_upto = max(self._trimmed_upto, cutoff)
+
+    def _thinking_budget(self) -> int:
+        """Thinking tokens for the next turn, scaled by findings gathered so far."""
+        findings = self._finding_queue.stored_count + self._finding_queue.pending_count
+        budget = THINKING_BUDGET_MIN + THINKING_TOKENS_PER_FINDING * findings
+        return min(budget, THINKING_BUDGET_MAX)
+
+    async def _cancel_tool_tasks(self, tasks: list[asyncio.Task]) -> None:
+        """Cancel tool calls started during a turn whose tools won't be used."""
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
     async def _drain_queue(self) -> None:
         """Wait for all queued findings to be stored."""
         pending = self._finding_queue.pending_count
         if pending > 0:
             console.print(f"[dim]Waiting for {pending} findings to be stored...[/dim]")
         await self._finding_queue.stop()
+        await asyncio.to_thread(self._memory.flush)
         if self._finding_queue.failed_count > 0:
             console.print(
                 f"[yellow]Warning: {self._finding_queue.failed_count} findings failed to store[/yellow]"
@@ -165,10 +368,31 @@ class ResearchAgent:
         """
         # Start the finding queue worker
         await self._finding_queue.start()
-
+        try:
+            return await self._run_turns(brief, wikipedia_context, research_plan)
+        except BaseException:
+            # Store and save the findings gathered before the failure or
+            # interrupt, so they reach both SQLite and the vector index
+            await self._drain_queue()
+            raise
+
+    async def _run_turns(
+        self,
+        brief: ResearchBrief,
+        wikipedia_context: WikipediaContext,
+        research_plan: ResearchPlan,
+    ) -> str:
+        """Run turns until the agent finishes, draining the finding queue on exit."""
         # Build system prompt
         system_prompt = build_system_prompt(brief, wikipedia_context, research_plan)
 
+        # Tools and system prompt are fixed for the run. A cache breakpoint at the
+        # end of the system block (which follows the tools) lets every later turn
+        # read that whole prefix from the prompt cache instead of re-processing it.
+        system_blocks = [
+            {"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}
+        ]
+
         # Initialize messages
         self._messages = [
             {
@@ -177,6 +401,7 @@ class ResearchAgent:
             }
         ]
 
+        self._trimmed_upto = 0
         self._turn_count = 0
         max_turns = Config.MAX_AGENT_TURNS
 
@@ -194,22 +419,42 @@ class ResearchAgent:
             # Call Claude
             api_params = {
                 "model": self._model,
-                "max_tokens": 16000 if self._thinking else 4096,
-                "system": system_prompt,
+                "max_tokens": 4096,
+                "system": system_blocks,
                 "tools": TOOLS,
                 "messages": self._messages,
             }
 
             if self._thinking:
+                budget = self._thinking_budget()
+                api_params["max_tokens"] = budget + RESPONSE_TOKENS
                 api_params["thinking"] = {
                     "type": "enabled",
-                    "budget_tokens": 10000,
+                    "budget_tokens": budget,
                 }
 
-            response = self._client.messages.create(**api_params)
-
-            # Track token usage
-            self._total_input_tokens += response.usage.input_tokens
+            # Stream the response and start each tool as soon as its input is
+            # complete, so tools run while the rest of the turn is generated
+            tool_tasks: list[asyncio.Task] = []
+            try:
+                async with self._client.messages.stream(**api_params) as stream:
+                    async for event in stream:
+                        if event.type == "content_block_stop" and event.content_block.type == "tool_use":
+                            block = event.content_block
+                            self._log_tool_call(block)
+                            tool_tasks.append(asyncio.create_task(self._execute_block(block)))
+                    response = await stream.get_final_message()
+            except BaseException:
+                await self._cancel_tool_tasks(tool_tasks)
+                raise
+
+            # Track token usage (input_tokens excludes prompt-cache reads and writes)
+            usage = response.usage
+            cache_read_tokens = usage.cache_read_input_tokens or 0
+            self._total_input_tokens += (
+                usage.input_tokens + (usage.cache_creation_input_tokens or 0) + cache_read_tokens
+            )
+            self._total_cached_input_tokens += cache_read_tokens
             self._total_output_tokens += response.usage.output_tokens
 
             # Parse response content - separate thinking from text
@@ -223,93 +468,59 @@ class ResearchAgent:
 
             # Show agent's thinking and reasoning if verbose
             if self._verbose:
+                blocks = []
                 if thinking_content.strip():
                     # Truncate very long thinking for display
                     display_thinking = thinking_content.strip()
                     if len(display_thinking) > 1000:
                         display_thinking = display_thinking[:1000] + "\n... [truncated]"
-                    console.print(Panel(
-                        display_thinking,
-                        title="[dim]Thinking[/dim]",
-                        border_style="dim",
-                    ))
+                    blocks.append(self._render_block(display_thinking, "Thinking", "dim"))
                 if text_content.strip():
-                    console.print(Panel(
-                        text_content.strip(),
-                        title="[yellow]Agent[/yellow]",
-                        border_style="dim",
-                    ))
+                    blocks.append(self._render_block(text_content.strip(), "Agent", "yellow"))
+                if blocks:
+                    # One print per turn instead of one per block
+                    console.print(Group(*blocks))
 
             if "RESEARCH_COMPLETE" in text_content:
                 console.print(Panel("[green]Research complete![/green]"))
-                await self._drain_queue()
+                # Finish storing findings while unused tool calls wind down
+                await asyncio.gather(self._drain_queue(), self._cancel_tool_tasks(tool_tasks))
                 return text_content
 
+            # Tool results are only used on a tool_use turn
+            if tool_tasks and response.stop_reason != "tool_use":
+                await self._cancel_tool_tasks(tool_tasks)
+                tool_tasks = []
+
             # Handle tool use
             if response.stop_reason == "tool_use":
                 # Add assistant response to messages
                 self._messages.append({"role": "assistant", "content": response.content})
 
-                # Collect all tool calls
-                tool_blocks = [block for block in response.content if block.type == "tool_use"]
+                # Wait for the tools started while the response streamed,
+                # logging each one as it finishes
+                if len(tool_tasks) > 1:
+                    console.print(f"  [cyan]Waiting on {len(tool_tasks)} tools running in parallel...[/cyan]")
 
-                # Log what we're about to execute
-                if len(tool_blocks) > 1:
-                    console.print(f"  [cyan]Executing {len(tool_blocks)} tools in parallel...[/cyan]")
+                for next_done in asyncio.as_completed(tool_tasks):
+                    block, result = await next_done
+                    self._log_tool_result(block, result)
 
-                for block in tool_blocks:
-                    console.print(
-                        f"  [cyan]Tool:[/cyan] {block.name}",
-                        highlight=False,
-                    )
-                    # Log tool input for debugging
-                    if block.name == "web_search":
-                        console.print(
-                            f"    [dim]Query: {block.input.get('query', '')}[/dim]"
-                        )
-                    elif block.name == "get_page_content":
-                        url = block.input.get("url", "")
-                        console.print(f"    [dim]URL: {url[:80]}...[/dim]" if len(url) > 80 else f"    [dim]URL: {url}[/dim]")
-                    elif block.name == "store_finding":
-                        finding_type = block.input.get("finding_type", "paraphrase")
-                        text = block.input.get("text", "")[:80]
-                        console.print(f"    [dim][{finding_type}] {text}...[/dim]")
-
-                # Execute all tool calls in parallel
-                async def execute_with_block(block):
-                    result = await self._execute_tool(block.name, block.input)
-                    return block, result
-
-                results = await asyncio.gather(*[execute_with_block(block) for block in tool_blocks])
-
-                # Process results and build tool_results list
+                # Build tool_results in the order the model issued the calls
                 tool_results = []
-                for block, result in results:
-                    # Log result summary
-                    if block.name == "web_search" and isinstance(result, list):
-                        console.print(f"  [green]{block.name}: Found {len(result)} results[/green]")
-                    elif block.name == "store_finding":
-                        if isinstance(result, dict) and result.get("status") == "error":
-                            console.print(f"  [red]{block.name}: {result.get('error', 'Error')}[/red]")
-                        else:
-                            console.print(f"  [green]{block.name}: Queued[/green]")
-                    elif block.name == "get_page_content":
-                        console.print(f"  [green]{block.name}: Done[/green]")
-                    elif block.name == "get_memory_stats" and isinstance(result, dict):
-                        console.print(
-                            f"  [green]{block.name}: Findings: {result.get('total_findings', 0)}, Sources: {result.get('unique_sources', 0)}[/green]"
-                        )
-
+                for task in tool_tasks:
+                    block, result = task.result()
                     tool_results.append(
                         {
                             "type": "tool_result",
                             "tool_use_id": block.id,
-                            "content": json.dumps(result),
+                            "content": orjson.dumps(result).decode(),
                         }
                     )
 
                 # Add tool results
                 self._messages.append({"role": "user", "content": tool_results})
+                self._trim_history()
 
             elif response.stop_reason == "end_turn":
                 # Model finished without tool use
@@ -360,6 +571,11 @@ class ResearchAgent:
         """Return total input tokens used."""
         return self._total_input_tokens
 
+    @property
+    def total_cached_input_tokens(self) -> int:
+        """Return input tokens served from the prompt cache."""
+        return self._total_cached_input_tokens
+
     @property
     def total_output_tokens(self) -> int:
         """Return total output tokens used."""
@@ -116,14 +116,15 @@ IMPORTANT: Findings should be detailed and substantive. Avoid superficial one-se
     },
     {
         "name": "search_findings",
-        "description": """Semantic search through stored findings. Use this to:
+        "description": """Search through stored findings (semantic + keyword). Use this to:
 
 1. Check what you already know before searching the web (avoid redundant searches)
 2. Find related information you've already gathered
 3. Verify if you have coverage of a topic
 4. Connect information across different sources
 
-The search is semantic, so use natural language queries.""",
+The search combines semantic matching with keyword matching, so natural language queries work and
+exact names, URLs or phrases are found too. Each result's match_type says which matched it.""",
         "input_schema": {
             "type": "object",
             "properties": {
@@ -20,20 +20,55 @@ class Config:
     KNOWLEDGE_STORE_DIR: Path = Path(
         os.getenv("KNOWLEDGE_STORE_DIR", str(PROJECT_ROOT / "knowledge_stores"))
     )
+    TOOL_CACHE_DIR: Path = Path(
+        os.getenv("TOOL_CACHE_DIR", str(KNOWLEDGE_STORE_DIR / "tool_cache"))
+    )
+    WIKIPEDIA_CACHE_DIR: Path = Path(
+        os.getenv("WIKIPEDIA_CACHE_DIR", str(Path.home() / ".cache" / "research_agent" / "wiki"))
+    )
+    # Browser profile, kept between runs for its HTTP cache and cookies
+    BROWSER_PROFILE_DIR: Path = Path(
+        os.getenv("BROWSER_PROFILE_DIR", str(Path.home() / ".cache" / "research_agent" / "browser"))
+    )
 
     # Model configuration
     CLAUDE_MODEL: str = os.getenv("CLAUDE_MODEL", "claude-sonnet-4-20250514")
     CLAUDE_FAST_MODEL: str = os.getenv("CLAUDE_FAST_MODEL", "claude-haiku-4-5-20251001")
     EMBEDDING_MODEL: str = os.getenv("EMBEDDING_MODEL", "Qwen/Qwen3-Embedding-4B")
     EMBEDDING_DIM: int = 2560  # Qwen3-Embedding-4B dimension
+    # "onnx" runs the embedding model on ONNX Runtime when no GPU is available
+    EMBEDDING_BACKEND: str = os.getenv("EMBEDDING_BACKEND", "torch").lower()
+    ONNX_CACHE_DIR: Path = Path(
+        os.getenv("ONNX_CACHE_DIR", str(Path.home() / ".cache" / "research_agent" / "onnx"))
+    )
+    # Compile the model with torch.compile on CUDA (slower start, faster encodes)
+    EMBEDDING_COMPILE: bool = os.getenv("EMBEDDING_COMPILE", "false").lower() == "true"
+    # With the onnx backend, quantize weights to INT8 for this instruction set
+    # ("avx512_vnni", "avx2", "arm64", ...); empty keeps full precision
+    EMBEDDING_QUANTIZATION: str = os.getenv("EMBEDDING_QUANTIZATION", "")
+
+    # Vector search configuration
+    HNSW_EF_SEARCH: int = int(os.getenv("HNSW_EF_SEARCH", "50"))  # Search-time ef (recall vs speed)
+    # Graph build parameters; only apply when a store's index is first created
+    HNSW_M: int = int(os.getenv("HNSW_M", "16"))
+    HNSW_EF_CONSTRUCTION: int = int(os.getenv("HNSW_EF_CONSTRUCTION", "200"))
 
     # Browser configuration
     # Headless mode supported with playwright-stealth (Yahoo search + consent dialog handling)
     BROWSER_HEADLESS: bool = os.getenv("BROWSER_HEADLESS", "false").lower() == "true"
     PAGE_TIMEOUT_MS: int = int(os.getenv("PAGE_TIMEOUT_MS", "30000"))
+    MAX_DOWNLOAD_BYTES: int = int(
+        os.getenv("MAX_DOWNLOAD_BYTES", str(10 * 1024 * 1024))
+    )  # Larger pages are skipped instead of loaded
 
     # Agent configuration
     MAX_AGENT_TURNS: int = int(os.getenv("MAX_AGENT_TURNS", "100"))
+    MAX_CONCURRENT_TOOLS: int = int(
+        os.getenv("MAX_CONCURRENT_TOOLS", "4")
+    )  # Browser tools running at once
+    FINDING_WORKERS: int = int(
+        os.getenv("FINDING_WORKERS", "1")
+    )  # Background workers storing findings
     MAX_CONTENT_LENGTH: int = int(
         os.getenv("MAX_CONTENT_LENGTH", "15000")
     )  # Max chars per page
@@ -1,13 +1,37 @@
 """Qwen3-Embedding-4B model wrapper with singleton pattern and lazy loading."""
 
+import importlib.util
+import os
+import queue
 import threading
-from typing import ClassVar
+import warnings
+from collections import OrderedDict
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, ClassVar
 
-import torch
-from sentence_transformers import SentenceTransformer
+import numpy as np
 
 from research_agent.config import Config
 
+# Most single-text requests folded into one forward pass
+COALESCE_MAX_BATCH = 32
+
+# Query embeddings kept for repeated searches (about 10 KB each)
+QUERY_CACHE_SIZE = 1024
+
+# An INT8 model is only used if its embeddings of the probe texts stay this
+# close (cosine similarity) to the full-precision model's
+QUANTIZATION_MIN_SIMILARITY = 0.99
+
+# Short, varied texts for checking and warming up a model
+PROBE_TEXTS = [
+    "The mitochondria is the powerhouse of the cell.",
+    "What were the main causes of the 2008 financial crisis?",
+    "Transformer models process tokens in parallel using self-attention.",
+    "Der schnelle braune Fuchs springt über den faulen Hund.",
+]
+
 
 class QwenEmbedder:
     """
@@ -26,6 +50,10 @@ class QwenEmbedder:
                     instance._model = None
                     instance._initialized = False
                     instance._device = None
+                    instance._pending = queue.Queue()
+                    instance._coalescer = None
+                    instance._query_cache = OrderedDict()
+                    instance._query_cache_lock = threading.Lock()
                     cls._instance = instance
         return cls._instance
 
@@ -38,6 +66,16 @@ class QwenEmbedder:
             if self._model is not None:
                 return
 
+            # Download weights with the Rust downloader when it is installed.
+            # Read when huggingface_hub is first imported, just below.
+            if importlib.util.find_spec("hf_transfer") is not None:
+                os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
+            # Imported here so that importing this module (and everything that
+            # imports it) doesn't pay for loading torch until a model is needed
+            import torch
+            from sentence_transformers import SentenceTransformer
+
             # Determine device
             if torch.cuda.is_available():
                 self._device = "cuda"
@@ -46,21 +84,153 @@ class QwenEmbedder:
             else:
                 self._device = "cpu"
 
-            # Determine dtype based on device
+            # Determine dtype based on device. Qwen3 was trained in bfloat16,
+            # which also avoids float16 overflow; pre-Ampere GPUs lack it.
             if self._device == "cpu":
                 dtype = torch.float32
+            elif self._device == "cuda" and torch.cuda.is_bf16_supported():
+                dtype = torch.bfloat16
             else:
                 dtype = torch.float16
 
-            self._model = SentenceTransformer(
-                Config.EMBEDDING_MODEL,
-                device=self._device,
-                model_kwargs={"torch_dtype": dtype},
-                tokenizer_kwargs={"padding_side": "left"},
-            )
+            if self._device == "cuda":
+                # Let any remaining float32 matmuls use TF32 tensor cores
+                torch.set_float32_matmul_precision("high")
+
+            if self._device == "cpu" and Config.EMBEDDING_BACKEND == "onnx":
+                self._model = self._load_onnx_model()
+            else:
+                self._model = SentenceTransformer(
+                    Config.EMBEDDING_MODEL,
+                    device=self._device,
+                    model_kwargs={
+                        "torch_dtype": dtype,
+                        # Load safetensors shards straight into the target dtype
+                        # instead of materializing a float32 copy first
+                        "low_cpu_mem_usage": True,
+                        "use_safetensors": True,
+                    },
+                    tokenizer_kwargs={"padding_side": "left"},
+                )
+                if self._device == "cuda" and Config.EMBEDDING_COMPILE:
+                    self._compile_model(torch)
+            self._model.eval()
             self._initialized = True
 
-    def embed(self, texts: list[str], is_query: bool = False) -> list[list[float]]:
+    def _compile_model(self, torch: Any) -> None:
+        """
+        Compile the transformer with torch.compile to fuse its kernels.
+
+        Padded batch shapes vary from call to call, so the graph is compiled
+        with dynamic shapes (CUDA graphs need static ones and would recompile
+        for every new length). A warm-up encode moves the compile time to load
+        time instead of the first search.
+        """
+        transformer = self._model[0]
+        transformer.auto_model = torch.compile(transformer.auto_model, dynamic=True)
+        self._model.encode(PROBE_TEXTS, normalize_embeddings=True, show_progress_bar=False)
+
+    def _load_onnx_model(self) -> Any:
+        """
+        Load the model on ONNX Runtime for CPU inference.
+
+        The first load exports the model to ONNX and saves it under
+        Config.ONNX_CACHE_DIR; later loads reuse the export. ONNX Runtime
+        applies all graph optimizations (constant folding, op fusion) by default.
+        Requires the `onnx` extra.
+        """
+        from sentence_transformers import SentenceTransformer
+
+        export_dir = Config.ONNX_CACHE_DIR / Config.EMBEDDING_MODEL.replace("/", "--")
+        exported = export_dir.exists()
+
+        model = SentenceTransformer(
+            str(export_dir) if exported else Config.EMBEDDING_MODEL,
+            device="cpu",
+            backend="onnx",
+            model_kwargs={"provider": "CPUExecutionProvider"},
+            tokenizer_kwargs={"padding_side": "left"},
+        )
+        if not exported:
+            model.save_pretrained(str(export_dir))
+
+        if Config.EMBEDDING_QUANTIZATION:
+            model = self._load_quantized_onnx_model(model, export_dir)
+        return model
+
+    def _load_quantized_onnx_model(self, model: Any, export_dir: Path) -> Any:
+        """
+        Swap in a dynamically INT8-quantized copy of the exported model.
+
+        The quantized model is created once, next to the export, for the
+        instruction set named by Config.EMBEDDING_QUANTIZATION (e.g.
+        "avx512_vnni", "avx2", "arm64"). It is checked against `model` on
+        a few probe texts each load; if it drifts, `model` is kept.
+        """
+        from sentence_transformers import SentenceTransformer, export_dynamic_quantized_onnx_model
+
+        file_name = f"onnx/model_qint8_{Config.EMBEDDING_QUANTIZATION}.onnx"
+        if not (export_dir / file_name).exists():
+            export_dynamic_quantized_onnx_model(
+                model, Config.EMBEDDING_QUANTIZATION, str(export_dir)
+            )
+
+        quantized = SentenceTransformer(
+            str(export_dir),
+            device="cpu",
+            backend="onnx",
+            model_kwargs={"provider": "CPUExecutionProvider", "file_name": file_name},
+            tokenizer_kwargs={"padding_side": "left"},
+        )
+
+        reference = model.encode(PROBE_TEXTS, normalize_embeddings=True)
+        candidate = quantized.encode(PROBE_TEXTS, normalize_embeddings=True)
+        similarity = float(np.min(np.sum(reference * candidate, axis=1)))
+        if similarity < QUANTIZATION_MIN_SIMILARITY:
+            warnings.warn(
+                f"INT8 embedding model drifted (cosine similarity {similarity:.3f}); "
+                "using full precision",
+                stacklevel=2,
+            )
+            return model
+        return quantized
+
+    def _encode(self, texts: list[str], is_query: bool, batch_size: int = 32) -> np.ndarray:
+        """
+        Run the model and return a contiguous float32 (n, dim) array.
+
+        Rows are L2-normalized, which the inner-product HNSW index relies on.
+        sentence-transformers sorts the texts by length before splitting them
+        into batches of `batch_size`, so each batch pads to a similar length,
+        and returns rows in input order.
+        """
+        self._load_model()
+
+        import torch
+
+        # Stricter than the no_grad encode() uses: no autograd bookkeeping at all
+        with torch.inference_mode():
+            if is_query:
+                # Use query prompt for retrieval queries
+                embeddings = self._model.encode(
+                    texts,
+                    prompt_name="query",
+                    batch_size=batch_size,
+                    normalize_embeddings=True,
+                    show_progress_bar=False,
+                )
+            else:
+                # Use default for documents/passages
+                embeddings = self._model.encode(
+                    texts,
+                    batch_size=batch_size,
+                    normalize_embeddings=True,
+                    show_progress_bar=False,
+                )
+
+        return np.ascontiguousarray(embeddings, dtype=np.float32)
+
+    def embed(self, texts: list[str], is_query: bool = False) -> np.ndarray:
         """
         Generate embeddings for texts.
 
@@ -69,55 +239,100 @@ class QwenEmbedder:
             is_query: If True, use query prompt for better retrieval
 
         Returns:
-            List of embedding vectors
+            Contiguous float32 array of shape (len(texts), dim)
         """
-        self._load_model()
+        return self._encode(texts, is_query)
+
+    def embed_single(self, text: str, is_query: bool = False) -> np.ndarray:
+        """
+        Convenience method for single text embedding.
+
+        Returns a contiguous float32 vector of shape (dim,) that can be handed
+        to hnswlib without another copy.
+
+        Safe to call from several threads at once: requests that arrive while
+        the model is busy are embedded together in the next forward pass.
 
+        Query embeddings are cached, so repeated searches skip the model;
+        they are returned read-only because callers share them.
+        """
         if is_query:
-            # Use query prompt for retrieval queries
-            embeddings = self._model.encode(
-                texts,
-                prompt_name="query",
-                normalize_embeddings=True,
-                show_progress_bar=False,
-            )
-        else:
-            # Use default for documents/passages
-            embeddings = self._model.encode(
-                texts,
-                normalize_embeddings=True,
-                show_progress_bar=False,
-            )
+            with self._query_cache_lock:
+                vector = self._query_cache.get(text)
+                if vector is not None:
+                    self._query_cache.move_to_end(text)
+                    return vector
+
+        future: Future[np.ndarray] = Future()
+        self._pending.put((text, is_query, future))
+        self._start_coalescer()
+        vector = future.result()
+
+        if is_query:
+            # Copy so the cache doesn't keep the rest of the batch alive
+            vector = vector.copy()
+            vector.flags.writeable = False
+            with self._query_cache_lock:
+                self._query_cache[text] = vector
+                if len(self._query_cache) > QUERY_CACHE_SIZE:
+                    self._query_cache.popitem(last=False)
+        return vector
+
+    def _start_coalescer(self) -> None:
+        """Start the thread that batches embed_single requests, once."""
+        if self._coalescer is not None:
+            return
+
+        with self._lock:
+            if self._coalescer is None:
+                self._coalescer = threading.Thread(target=self._coalesce, daemon=True)
+                self._coalescer.start()
 
-        return embeddings.tolist()
+    def _coalesce(self) -> None:
+        """Embed queued single texts, batching whatever is waiting."""
+        while True:
+            # Block for one request, then take any others already queued;
+            # a lone caller never waits for a batch to fill
+            requests = [self._pending.get()]
+            while len(requests) < COALESCE_MAX_BATCH:
+                try:
+                    requests.append(self._pending.get_nowait())
+                except queue.Empty:
+                    break
 
-    def embed_single(self, text: str, is_query: bool = False) -> list[float]:
-        """Convenience method for single text embedding."""
-        return self.embed([text], is_query=is_query)[0]
+            # Queries and documents are encoded with different prompts
+            for is_query in (False, True):
+                group = [request for request in requests if request[1] == is_query]
+                if not group:
+                    continue
+                try:
+                    vectors = self._encode([text for text, _, _ in group], is_query)
+                except Exception as e:
+                    for _, _, future in group:
+                        future.set_exception(e)
+                else:
+                    for (_, _, future), vector in zip(group, vectors):
+                        future.set_result(vector)
 
     def embed_batch(
         self, texts: list[str], batch_size: int = 32, is_query: bool = False
-    ) -> list[list[float]]:
+    ) -> np.ndarray:
         """
         Embed texts in batches for memory efficiency.
 
+        All texts go to the model in one call, so batches are formed from
+        length-sorted texts rather than in input order.
+
         Args:
             texts: List of texts to embed
             batch_size: Number of texts per batch
             is_query: If True, use query prompt
 
         Returns:
-            List of embedding vectors
+            Contiguous float32 array of shape (len(texts), dim), in the same
+            order as `texts`
         """
-        self._load_model()
-
-        all_embeddings = []
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i : i + batch_size]
-            embeddings = self.embed(batch, is_query=is_query)
-            all_embeddings.extend(embeddings)
-
-        return all_embeddings
+        return self._encode(texts, is_query, batch_size=batch_size)
 
     @property
     def dimension(self) -> int:
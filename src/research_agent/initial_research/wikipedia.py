@@ -1,10 +1,44 @@
 """Wikipedia-based initial research for gathering background context."""
 
+import hashlib
 import re
-from dataclasses import dataclass
-
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from itertools import islice
+from pathlib import Path
+
+import orjson
 import wikipediaapi
 
+from research_agent.config import Config
+
+# How long a fetched page is reused before asking Wikipedia again, in seconds
+CACHE_TTL = 7 * 24 * 60 * 60
+
+# Concept heuristics: quoted phrases, "known as ..." phrases, capitalized phrases
+QUOTED_RE = re.compile(r'"([^"]+)"')
+KNOWN_AS_RE = re.compile(
+    r"(?:known as|called|referred to as|termed)\s+(?:the\s+)?([A-Z][a-z]+(?:\s+[A-Za-z]+)*)"
+)
+CAPITALIZED_PHRASE_RE = re.compile(r"\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)\b")
+# Names (First Last, or First Middle-initial Last)
+NAME_RE = re.compile(r"\b([A-Z][a-z]+\s+(?:[A-Z]\.\s+)?[A-Z][a-z]+)\b")
+
+# Common false positives
+STOP_PHRASES = frozenset({"The", "This", "These", "That", "Those", "In", "On", "At", "For"})
+STOP_NAMES = frozenset({
+    "United States",
+    "New York",
+    "Los Angeles",
+    "San Francisco",
+    "World War",
+    "North America",
+    "South America",
+    "European Union",
+})
+
 
 @dataclass
 class WikipediaContext:
@@ -24,29 +58,65 @@ def fetch_wikipedia_context(topic: str) -> WikipediaContext:
     """
     Fetch Wikipedia page for a topic to get high-level context.
 
+    Pages found are cached on disk for a week, shared by topics that differ
+    only in case or surrounding whitespace. Misses are not cached, so a page
+    created or renamed later is picked up on the next run.
+
     Args:
         topic: The research topic to look up
 
     Returns:
         WikipediaContext with extracted information
     """
+    cache_path = _cache_path(topic)
+    context = _load_cached(cache_path)
+    # Misses cached by earlier versions are looked up again
+    if context is not None and context.found:
+        return context
+
+    context = _fetch_from_wikipedia(topic)
+    if context.found:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_bytes(orjson.dumps(asdict(context)))
+        except OSError:
+            pass  # Caching is best effort
+    return context
+
+
+def _cache_path(topic: str) -> Path:
+    """Path of the cache file for a topic."""
+    key = hashlib.sha1(topic.strip().lower().encode()).hexdigest()
+    return Config.WIKIPEDIA_CACHE_DIR / f"{key}.json"
+
+
+def _load_cached(cache_path: Path) -> WikipediaContext | None:
+    """Load a cached context, or None if missing, stale or unreadable."""
+    try:
+        if time.time() - cache_path.stat().st_mtime > CACHE_TTL:
+            return None
+        return WikipediaContext(**orjson.loads(cache_path.read_bytes()))
+    except (OSError, orjson.JSONDecodeError, TypeError):
+        return None
+
+
+def _fetch_from_wikipedia(topic: str) -> WikipediaContext:
+    """Look up a topic on Wikipedia and extract context from its page."""
     wiki = wikipediaapi.Wikipedia(
         user_agent="ResearchAgent/1.0 (research-agent@example.com)",
         language="en",
     )
 
-    # Try to find the page
-    page = wiki.page(topic)
-
-    if not page.exists():
-        # Try with title case
-        page = wiki.page(topic.title())
+    # Try the topic as given, in title case, and with underscores. Each check
+    # is an HTTP round trip, so they run at once; the first variant that
+    # exists wins.
+    variants = list(dict.fromkeys([topic, topic.title(), topic.replace(" ", "_")]))
+    pages = [wiki.page(variant) for variant in variants]
+    with ThreadPoolExecutor(max_workers=len(pages)) as executor:
+        exists = list(executor.map(lambda candidate: candidate.exists(), pages))
+    page = next((p for p, found in zip(pages, exists) if found), None)
 
-    if not page.exists():
-        # Try search-like approach with underscores
-        page = wiki.page(topic.replace(" ", "_"))
-
-    if not page.exists():
+    if page is None:
         return WikipediaContext(
             title=topic,
             summary=f"No Wikipedia page found for '{topic}'. Research will proceed with web search.",
@@ -91,60 +161,32 @@ def extract_key_concepts(text: str) -> list[str]:
     """Extract key concepts from text using simple heuristics."""
     concepts = []
 
+    # Scanning stops once each heuristic has produced enough matches
+
     # Look for phrases in quotes
-    quoted = re.findall(r'"([^"]+)"', text)
-    concepts.extend(quoted[:5])
+    concepts.extend(islice((m.group(1) for m in QUOTED_RE.finditer(text)), 5))
 
     # Look for phrases with "known as", "called", "referred to as"
-    known_as = re.findall(
-        r"(?:known as|called|referred to as|termed)\s+(?:the\s+)?([A-Z][a-z]+(?:\s+[A-Za-z]+)*)",
-        text,
-    )
-    concepts.extend(known_as[:5])
+    concepts.extend(islice((m.group(1) for m in KNOWN_AS_RE.finditer(text)), 5))
 
     # Look for capitalized phrases (potential proper nouns/concepts)
-    caps = re.findall(r"\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)\b", text)
-    # Filter out common false positives
-    stop_phrases = {"The", "This", "These", "That", "Those", "In", "On", "At", "For"}
-    caps = [c for c in caps if c.split()[0] not in stop_phrases]
-    concepts.extend(caps[:10])
-
-    # Deduplicate while preserving order
-    seen = set()
-    unique_concepts = []
-    for c in concepts:
-        if c.lower() not in seen:
-            seen.add(c.lower())
-            unique_concepts.append(c)
+    caps = (m.group(1) for m in CAPITALIZED_PHRASE_RE.finditer(text))
+    concepts.extend(islice((c for c in caps if c.split()[0] not in STOP_PHRASES), 10))
 
-    return unique_concepts[:15]
+    return _unique_ignoring_case(concepts, limit=15)
 
 
 def extract_key_people(text: str) -> list[str]:
     """Extract potential person names from text."""
-    # Pattern for names (First Last, or First Middle Last)
-    name_pattern = r"\b([A-Z][a-z]+\s+(?:[A-Z]\.\s+)?[A-Z][a-z]+)\b"
-    names = re.findall(name_pattern, text)
-
-    # Filter out common false positives
-    stop_names = {
-        "United States",
-        "New York",
-        "Los Angeles",
-        "San Francisco",
-        "World War",
-        "North America",
-        "South America",
-        "European Union",
-    }
-    names = [n for n in names if n not in stop_names]
-
-    # Deduplicate
-    seen = set()
-    unique_names = []
-    for n in names:
-        if n.lower() not in seen:
-            seen.add(n.lower())
-            unique_names.append(n)
-
-    return unique_names[:10]
+    names = (m.group(1) for m in NAME_RE.finditer(text))
+    return _unique_ignoring_case((n for n in names if n not in STOP_NAMES), limit=10)
+
+
+def _unique_ignoring_case(items: Iterable[str], limit: int) -> list[str]:
+    """Deduplicate case-insensitively, keeping first occurrences in order, up to `limit`."""
+    unique: dict[str, str] = {}
+    for item in items:
+        unique.setdefault(item.lower(), item)
+        if len(unique) == limit:
+            break
+    return list(unique.values())
@@ -48,6 +48,15 @@ class ShutdownHandler:
             sys.exit(1)
 
 
+async def run_with_spinner(progress: Progress, description: str, func, *args):
+    """Run a blocking function in a thread, showing a spinner while it runs."""
+    task = progress.add_task(description, total=None)
+    try:
+        return await asyncio.to_thread(func, *args)
+    finally:
+        progress.remove_task(task)
+
+
 async def run_research(brief_path: str, output_dir: str | None = None, verbose: bool = False, fast: bool = False, thinking: bool = True) -> None:
     """Run the research agent with a given brief."""
 
@@ -79,23 +88,31 @@ async def run_research(brief_path: str, output_dir: str | None = None, verbose:
         for q in brief.specific_questions:
             console.print(f"  - {q}")
 
-    # Preload embedding model (downloads weights if needed)
+    # Load the embedding model (downloads weights if needed) while fetching
+    # Wikipedia context; neither depends on the other
     console.print()
-    console.print(Panel("Loading Embedding Model"))
+    console.print(Panel("Loading Embedding Model and Wikipedia Context"))
 
     embedder = QwenEmbedder()
-    if not embedder.is_loaded:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task(
-                f"Loading {Config.EMBEDDING_MODEL} (this may download ~8GB on first run)...",
-                total=None,
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+    ) as progress:
+        jobs = [
+            run_with_spinner(
+                progress, "Fetching Wikipedia context...", fetch_wikipedia_context, brief.topic
             )
-            embedder._load_model()
-            progress.remove_task(task)
+        ]
+        if not embedder.is_loaded:
+            jobs.append(
+                run_with_spinner(
+                    progress,
+                    f"Loading {Config.EMBEDDING_MODEL} (this may download ~8GB on first run)...",
+                    embedder._load_model,
+                )
+            )
+        wikipedia_context, *_ = await asyncio.gather(*jobs)
 
     console.print(f"[green]Model loaded on device:[/green] {embedder.device}")
 
@@ -103,15 +120,6 @@ async def run_research(brief_path: str, output_dir: str | None = None, verbose:
     console.print()
     console.print(Panel("Step 1: Initial Research (Wikipedia)"))
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Fetching Wikipedia context...", total=None)
-        wikipedia_context = fetch_wikipedia_context(brief.topic)
-        progress.remove_task(task)
-
     if wikipedia_context.found:
         console.print(f"[green]Found Wikipedia page:[/green] {wikipedia_context.title}")
         console.print(f"[dim]Summary: {wikipedia_context.summary[:200]}...[/dim]")
@@ -190,6 +198,7 @@ async def run_research(brief_path: str, output_dir: str | None = None, verbose:
     console.print()
     console.print(Panel("Token Usage"))
     console.print(f"  Input tokens:  {agent.total_input_tokens:,}")
+    console.print(f"  Cached input:  {agent.total_cached_input_tokens:,}")
     console.print(f"  Output tokens: {agent.total_output_tokens:,}")
     console.print(f"  Total tokens:  {agent.total_tokens:,}")
 
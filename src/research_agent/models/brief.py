@@ -3,7 +3,7 @@
 from enum import Enum
 from typing import Literal
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field
 
 
 class DetailLevel(str, Enum):
@@ -77,21 +77,24 @@ class TimeFocus(BaseModel):
         description="Weight for historical information (0-1)",
     )
 
-    @model_validator(mode="after")
-    def normalize_weights(self) -> "TimeFocus":
-        """Ensure weights sum to 1.0."""
+    @property
+    def normalized_current(self) -> float:
+        """Current weight as a share of both weights (0.5 if both are zero)."""
         total = self.current_weight + self.historical_weight
-        if total > 0:
-            self.current_weight = self.current_weight / total
-            self.historical_weight = self.historical_weight / total
-        return self
+        return self.current_weight / total if total > 0 else 0.5
+
+    @property
+    def normalized_historical(self) -> float:
+        """Historical weight as a share of both weights (0.5 if both are zero)."""
+        total = self.current_weight + self.historical_weight
+        return self.historical_weight / total if total > 0 else 0.5
 
     @property
     def description(self) -> str:
         """Human-readable description of the time focus."""
-        if self.current_weight > 0.7:
+        if self.normalized_current > 0.7:
             return "Focus on recent developments and current state"
-        elif self.historical_weight > 0.7:
+        elif self.normalized_historical > 0.7:
             return "Focus on historical context and evolution"
         return "Balance current and historical perspectives"
 
@@ -137,22 +140,19 @@ class ResearchBrief(BaseModel):
     @classmethod
     def from_json_file(cls, path: str) -> "ResearchBrief":
         """Load and validate a research brief from a JSON file."""
-        import json
         from pathlib import Path
 
         file_path = Path(path)
         if not file_path.exists():
             raise FileNotFoundError(f"Research brief not found: {path}")
 
-        with open(file_path) as f:
-            data = json.load(f)
-
-        return cls.model_validate(data)
+        # Parse and validate in one pass with pydantic-core's JSON parser
+        return cls.model_validate_json(file_path.read_bytes())
 
     def get_search_date_preference(self) -> str | None:
         """Get Google date filter based on time focus."""
-        if self.time_focus.current_weight > 0.7:
+        if self.time_focus.normalized_current > 0.7:
             return "y"  # Past year
-        elif self.time_focus.current_weight > 0.5:
+        elif self.time_focus.normalized_current > 0.5:
             return "y2"  # Past 2 years (custom)
         return None  # No date restriction
@@ -8,7 +8,7 @@ from typing import Any, Literal
 FindingType = Literal["direct_quote", "paraphrase", "summary", "synthesis"]
 
 
-@dataclass
+@dataclass(slots=True)
 class Citation:
     """Citation metadata for a research finding."""
 
@@ -19,14 +19,19 @@ class Citation:
     accessed_date: str = field(default_factory=lambda: datetime.utcnow().isoformat())
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for storage in hnsqlite metadata."""
-        return {
-            "source_url": self.source_url,
-            "title": self.title,
-            "author": self.author,
-            "publication_date": self.publication_date,
-            "accessed_date": self.accessed_date,
-        }
+        """
+        Convert to dictionary for storage in hnsqlite metadata.
+
+        Unknown author and publication date are left out rather than stored
+        as nulls; readers treat a missing key as None.
+        """
+        data = {"source_url": self.source_url, "title": self.title}
+        if self.author is not None:
+            data["author"] = self.author
+        if self.publication_date is not None:
+            data["publication_date"] = self.publication_date
+        data["accessed_date"] = self.accessed_date
+        return data
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Citation":
@@ -52,7 +57,7 @@ class Citation:
         return f"{index}. " + ". ".join(parts) + "."
 
 
-@dataclass
+@dataclass(slots=True)
 class Finding:
     """A research finding with citation."""
 
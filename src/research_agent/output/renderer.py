@@ -1,6 +1,9 @@
 """Render research findings into final document format."""
 
+from collections import defaultdict
 from datetime import datetime
+from heapq import nlargest
+from operator import attrgetter
 from pathlib import Path
 
 from research_agent.models.brief import ResearchBrief
@@ -65,27 +68,21 @@ def render_document(
 
 def build_bibliography(findings: list[Finding]) -> list[BibliographyEntry]:
     """Build deduplicated bibliography from findings."""
-    seen_urls = set()
-    entries = []
-    index = 1
+    entries: dict[str, BibliographyEntry] = {}
 
     for finding in findings:
-        url = finding.citation.source_url
-        if url not in seen_urls:
-            seen_urls.add(url)
-            entries.append(
-                BibliographyEntry(
-                    index=index,
-                    title=finding.citation.title,
-                    url=url,
-                    author=finding.citation.author,
-                    publication_date=finding.citation.publication_date,
-                    accessed_date=finding.citation.accessed_date,
-                )
+        citation = finding.citation
+        if citation.source_url not in entries:
+            entries[citation.source_url] = BibliographyEntry(
+                index=len(entries) + 1,
+                title=citation.title,
+                url=citation.source_url,
+                author=citation.author,
+                publication_date=citation.publication_date,
+                accessed_date=citation.accessed_date,
             )
-            index += 1
 
-    return entries
+    return list(entries.values())
 
 
 def organize_into_sections(
@@ -97,26 +94,21 @@ def organize_into_sections(
 
     # Group findings by their relevance notes (simplified approach)
     # A more sophisticated version would use clustering
-    sections_dict: dict[str, list[tuple[Finding, int]]] = {}
+    sections_dict: defaultdict[str, list[tuple[Finding, int]]] = defaultdict(list)
 
     for finding in findings:
-        # Use first few words of relevance notes as section key
-        key = finding.relevance_notes.split(".")[0][:50] if finding.relevance_notes else "General"
-        if key not in sections_dict:
-            sections_dict[key] = []
+        # Use the first sentence of the relevance notes (up to 50 chars) as section key
+        notes = finding.relevance_notes
+        key = notes.partition(".")[0][:50] if notes else "General"
         citation_idx = source_to_index.get(finding.citation.source_url, 0)
         sections_dict[key].append((finding, citation_idx))
 
     # Convert to sections
     sections = []
     for heading, items in sections_dict.items():
-        content_parts = []
-        citations = []
-
-        for finding, citation_idx in items:
-            content_parts.append(f"- {finding.text}")
-            if citation_idx and citation_idx not in citations:
-                citations.append(citation_idx)
+        content_parts = [f"- {finding.text}" for finding, _ in items]
+        # Distinct citation indices in first-seen order
+        citations = list(dict.fromkeys(idx for _, idx in items if idx))
 
         sections.append(
             DocumentSection(
@@ -131,11 +123,9 @@ def organize_into_sections(
 
 def extract_key_findings(findings: list[Finding], max_findings: int = 10) -> list[str]:
     """Extract the most important findings."""
-    # Sort by confidence and take top N
-    sorted_findings = sorted(findings, key=lambda f: f.confidence, reverse=True)
-
+    # Take the top N by confidence, without sorting the rest
     key_findings = []
-    for finding in sorted_findings[:max_findings]:
+    for finding in nlargest(max_findings, findings, key=attrgetter("confidence")):
         # Truncate if too long
         text = finding.text
         if len(text) > 200:
@@ -150,7 +140,7 @@ def generate_executive_summary(
 ) -> str:
     """Generate an executive summary."""
     num_findings = len(findings)
-    num_sources = len(set(f.citation.source_url for f in findings))
+    num_sources = len(set(map(attrgetter("citation.source_url"), findings)))
 
     summary_parts = [
         f"This research report covers the topic of **{brief.topic}** at a {brief.detail_level.value} level of detail.",
@@ -237,4 +227,4 @@ def save_document(document: ResearchDocument, output_path: str | Path) -> None:
     """Save document to a markdown file."""
     path = Path(output_path)
     markdown = render_to_markdown(document)
-    path.write_text(markdown, encoding="utf-8")
+    path.write_bytes(markdown.encode("utf-8"))
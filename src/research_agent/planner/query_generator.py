@@ -1,10 +1,19 @@
 """Research plan generation with search queries."""
 
+import re
 from dataclasses import dataclass
 
 from research_agent.initial_research.wikipedia import WikipediaContext
 from research_agent.models.brief import DetailLevel, ResearchBrief
 
+# Question words stripped when turning a question into a search query
+QUESTION_WORDS_RE = re.compile(r"What is|How does|Why|When")
+
+# Wikipedia section headings that are not worth researching as subtopics
+SKIPPED_SUBTOPICS = frozenset(
+    {"see also", "references", "external links", "notes", "further reading"}
+)
+
 
 @dataclass
 class ResearchPlan:
@@ -73,7 +82,7 @@ def generate_research_plan(
         aims.append("Identify gaps in current knowledge")
 
     # Add time-focused queries based on time_focus
-    if brief.time_focus.current_weight > 0.6:
+    if brief.time_focus.normalized_current > 0.6:
         queries.extend(
             [
                 f'"{topic}" 2024 2025 latest',
@@ -82,7 +91,7 @@ def generate_research_plan(
             ]
         )
         aims.append("Focus on recent developments and current state")
-    elif brief.time_focus.historical_weight > 0.6:
+    elif brief.time_focus.normalized_historical > 0.6:
         queries.extend(
             [
                 f'"{topic}" history origins',
@@ -98,8 +107,7 @@ def generate_research_plan(
     # Add queries for specific questions
     for question in brief.specific_questions:
         # Convert question to search query
-        query = question.rstrip("?").replace("What is", "").replace("How does", "")
-        query = query.replace("Why", "").replace("When", "").strip()
+        query = QUESTION_WORDS_RE.sub("", question.rstrip("?")).strip()
         queries.append(f'"{topic}" {query}')
         aims.append(f"Answer: {question}")
 
@@ -117,7 +125,7 @@ def generate_research_plan(
 
         # Add queries for subtopics
         for subtopic in wikipedia_context.subtopics[:5]:
-            if subtopic.lower() not in ["see also", "references", "external links", "notes", "further reading"]:
+            if subtopic.casefold() not in SKIPPED_SUBTOPICS:
                 queries.append(f'"{topic}" "{subtopic}"')
                 follow_up_items.append(f"Explore subtopic: {subtopic}")
 
@@ -131,17 +139,13 @@ def generate_research_plan(
             ]
         )
 
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_queries = []
+    # Remove case-insensitive duplicates, keeping the first spelling in order
+    unique_queries: dict[str, str] = {}
     for q in queries:
-        q_lower = q.lower()
-        if q_lower not in seen:
-            seen.add(q_lower)
-            unique_queries.append(q)
+        unique_queries.setdefault(q.casefold(), q)
 
     return ResearchPlan(
-        queries=unique_queries,
+        queries=list(unique_queries.values()),
         aims=aims,
         follow_up_items=follow_up_items,
     )
@@ -149,21 +153,14 @@ def generate_research_plan(
 
 def format_plan_for_display(plan: ResearchPlan) -> str:
     """Format a research plan for human-readable display."""
-    lines = ["## Research Plan", ""]
-
-    lines.append("### Search Queries")
-    for i, query in enumerate(plan.queries, 1):
-        lines.append(f"{i}. `{query}`")
-    lines.append("")
-
-    lines.append("### Research Aims")
-    for aim in plan.aims:
-        lines.append(f"- {aim}")
+    lines = ["## Research Plan", "", "### Search Queries"]
+    lines.extend(f"{i}. `{query}`" for i, query in enumerate(plan.queries, 1))
+    lines += ["", "### Research Aims"]
+    lines.extend(f"- {aim}" for aim in plan.aims)
     lines.append("")
 
     if plan.follow_up_items:
         lines.append("### Follow-up Items")
-        for item in plan.follow_up_items:
-            lines.append(f"- {item}")
+        lines.extend(f"- {item}" for item in plan.follow_up_items)
 
     return "\n".join(lines)
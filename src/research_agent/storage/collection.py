@@ -1,26 +1,34 @@
 """Simple vector collection using SQLite for storage and hnswlib for search."""
 
-import json
+import re
 import sqlite3
 import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 import hnswlib
 import numpy as np
+import orjson
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    """Return a normalized copy, leaving the caller's array untouched."""
+    return vectors / (np.linalg.norm(vectors, axis=1, keepdims=True) + 1e-12)
 
 
 @dataclass
 class Embedding:
     """An embedding with text and metadata."""
 
-    vector: list[float]
+    vector: list[float] | np.ndarray
     text: str
     doc_id: str
     metadata: dict[str, Any] = field(default_factory=dict)
-    created_at: float = field(default_factory=lambda: datetime.utcnow().timestamp())
+    created_at: float = field(default_factory=time.time)
 
 
 @dataclass
@@ -40,6 +48,14 @@ class Collection:
 
     Stores text and metadata in SQLite, vectors in hnswlib index.
     Both are persisted to disk.
+
+    The index uses inner-product space. Vectors and queries are normalized
+    once on the way in, so its distance 1 - dot is the cosine distance
+    without hnswlib re-normalizing on every comparison.
+
+    Rewriting the index file costs time proportional to its size, so adds
+    save it only every `save_every` additions or `save_interval` seconds.
+    Call flush() when done adding, or add inside bulk_load().
     """
 
     def __init__(
@@ -50,6 +66,8 @@ class Collection:
         ef_construction: int = 200,
         M: int = 16,
         ef_search: int = 50,
+        save_every: int = 100,
+        save_interval: float = 30.0,
     ):
         """
         Initialize or load a collection.
@@ -61,6 +79,8 @@ class Collection:
             ef_construction: hnswlib ef_construction parameter
             M: hnswlib M parameter
             ef_search: hnswlib ef parameter for search
+            save_every: Save the index after this many unsaved additions
+            save_interval: Save the index if unsaved additions are this many seconds old
         """
         self.name = name
         self.dimension = dimension
@@ -68,8 +88,16 @@ class Collection:
         self.ef_construction = ef_construction
         self.M = M
         self.ef_search = ef_search
+        self.save_every = save_every
+        self.save_interval = save_interval
 
         self._lock = threading.Lock()
+        self._local = threading.local()  # One SQLite connection per thread
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._unsaved = 0  # Additions not yet written to the index file
+        self._last_save = time.monotonic()
+        self._bulk_loading = False
         self._db_path = self.path / f"{name}.db"
         self._index_path = self.path / f"{name}.index"
 
@@ -85,6 +113,9 @@ class Collection:
     def _init_db(self) -> None:
         """Initialize SQLite database."""
         with sqlite3.connect(self._db_path) as conn:
+            # Persistent: readers no longer block the writer, and commits
+            # append to the log instead of rewriting pages
+            conn.execute("PRAGMA journal_mode=WAL")
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS embeddings (
                     id INTEGER PRIMARY KEY,
@@ -95,11 +126,41 @@ class Collection:
                 )
             """)
             conn.execute("CREATE INDEX IF NOT EXISTS idx_doc_id ON embeddings(doc_id)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_created_at ON embeddings(created_at)")
+
+            # Full-text index over the texts, kept in sync by triggers
+            has_fts = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'embeddings_fts'"
+            ).fetchone()
+            conn.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS embeddings_fts
+                USING fts5(text, content='embeddings', content_rowid='id')
+            """)
+            conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS embeddings_fts_insert AFTER INSERT ON embeddings BEGIN
+                    INSERT INTO embeddings_fts(rowid, text) VALUES (new.id, new.text);
+                END
+            """)
+            conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS embeddings_fts_delete AFTER DELETE ON embeddings BEGIN
+                    INSERT INTO embeddings_fts(embeddings_fts, rowid, text) VALUES ('delete', old.id, old.text);
+                END
+            """)
+            conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS embeddings_fts_update AFTER UPDATE OF text ON embeddings BEGIN
+                    INSERT INTO embeddings_fts(embeddings_fts, rowid, text) VALUES ('delete', old.id, old.text);
+                    INSERT INTO embeddings_fts(rowid, text) VALUES (new.id, new.text);
+                END
+            """)
+            if not has_fts:
+                # Index texts stored before the full-text table existed
+                conn.execute("INSERT INTO embeddings_fts(embeddings_fts) VALUES ('rebuild')")
+
             conn.commit()
 
     def _init_index(self) -> None:
         """Initialize or load hnswlib index."""
-        self._index = hnswlib.Index(space="cosine", dim=self.dimension)
+        self._index = hnswlib.Index(space="ip", dim=self.dimension)
 
         if self._index_path.exists():
             # Load existing index
@@ -116,8 +177,67 @@ class Collection:
             self._index.set_ef(self.ef_search)
 
     def _get_connection(self) -> sqlite3.Connection:
-        """Get a new database connection."""
-        return sqlite3.connect(self._db_path)
+        """
+        Get this thread's database connection, opening it on first use.
+
+        Used as `with self._get_connection() as conn:`, which commits or
+        rolls back on exit but leaves the connection open for reuse.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # close() may run on another thread
+            conn = sqlite3.connect(self._db_path, check_same_thread=False)
+            # WAL only needs to fsync at checkpoints, not on every commit
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def close(self) -> None:
+        """Save any deferred index additions and close every thread's database connection."""
+        self.flush()
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+
+    def _save_index(self) -> None:
+        """Write the index to disk. Caller must hold the lock."""
+        self._index.save_index(str(self._index_path))
+        self._unsaved = 0
+        self._last_save = time.monotonic()
+
+    def _note_additions(self, count: int) -> None:
+        """Save the index if enough unsaved additions have piled up. Caller must hold the lock."""
+        self._unsaved += count
+        if self._bulk_loading:
+            return
+        if (
+            self._unsaved >= self.save_every
+            or time.monotonic() - self._last_save >= self.save_interval
+        ):
+            self._save_index()
+
+    def flush(self) -> None:
+        """Write the index to disk if it has unsaved additions."""
+        with self._lock:
+            if self._unsaved:
+                self._save_index()
+
+    @contextmanager
+    def bulk_load(self) -> Iterator["Collection"]:
+        """Defer all index saves until the block exits, then save once."""
+        with self._lock:
+            self._bulk_loading = True
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._bulk_loading = False
+            self.flush()
 
     def _resize_index_if_needed(self, new_count: int) -> None:
         """Resize index if we're running out of space."""
@@ -138,7 +258,7 @@ class Collection:
                     (
                         embedding.doc_id,
                         embedding.text,
-                        json.dumps(embedding.metadata),
+                        orjson.dumps(embedding.metadata).decode(),
                         embedding.created_at,
                     ),
                 )
@@ -147,48 +267,48 @@ class Collection:
 
             # Add to index
             self._resize_index_if_needed(row_id)
-            vector = np.array([embedding.vector], dtype=np.float32)
+            # A view when the vector is already a float32 ndarray
+            vector = _normalize(np.asarray(embedding.vector, dtype=np.float32).reshape(1, -1))
             self._index.add_items(vector, [row_id])
-
-            # Persist index
-            self._index.save_index(str(self._index_path))
+            self._note_additions(1)
 
     def add_batch(self, embeddings: list[Embedding]) -> None:
         """Add multiple embeddings efficiently."""
         if not embeddings:
             return
 
-        with self._lock:
-            row_ids = []
-            vectors = []
+        rows = [
+            (emb.doc_id, emb.text, orjson.dumps(emb.metadata).decode(), emb.created_at)
+            for emb in embeddings
+        ]
+        # Fill one preallocated buffer rather than building a list of rows first
+        vectors = np.empty((len(embeddings), self.dimension), dtype=np.float32)
+        for i, emb in enumerate(embeddings):
+            vectors[i] = emb.vector
+        vectors = _normalize(vectors)
 
+        with self._lock:
             with self._get_connection() as conn:
-                for emb in embeddings:
-                    cursor = conn.execute(
-                        """
-                        INSERT INTO embeddings (doc_id, text, metadata, created_at)
-                        VALUES (?, ?, ?, ?)
-                        """,
-                        (
-                            emb.doc_id,
-                            emb.text,
-                            json.dumps(emb.metadata),
-                            emb.created_at,
-                        ),
-                    )
-                    row_ids.append(cursor.lastrowid)
-                    vectors.append(emb.vector)
+                # Hold the write lock for the whole batch: with no other writer,
+                # SQLite assigns the new rows consecutive ids after the current max
+                conn.execute("BEGIN IMMEDIATE")
+                conn.executemany(
+                    """
+                    INSERT INTO embeddings (doc_id, text, metadata, created_at)
+                    VALUES (?, ?, ?, ?)
+                    """,
+                    rows,
+                )
+                last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
                 conn.commit()
+            row_ids = list(range(last_id - len(rows) + 1, last_id + 1))
 
             # Add to index
-            self._resize_index_if_needed(max(row_ids))
-            vectors_np = np.array(vectors, dtype=np.float32)
-            self._index.add_items(vectors_np, row_ids)
-
-            # Persist index
-            self._index.save_index(str(self._index_path))
+            self._resize_index_if_needed(last_id)
+            self._index.add_items(vectors, row_ids)
+            self._note_additions(len(row_ids))
 
-    def search(self, query_vector: list[float], k: int = 10) -> list[SearchResult]:
+    def search(self, query_vector: list[float] | np.ndarray, k: int = 10) -> list[SearchResult]:
         """
         Search for nearest neighbors.
 
@@ -199,39 +319,68 @@ class Collection:
         Returns:
             List of SearchResult objects, sorted by distance (ascending)
         """
-        current_count = self.count()
-        if current_count == 0:
-            return []
+        # A batch of one: a single knn_query and a single SQLite fetch
+        query = np.asarray(query_vector, dtype=np.float32).reshape(1, -1)
+        return self.search_batch(query, k=k)[0]
+
+    def search_batch(
+        self, query_vectors: list[list[float]] | np.ndarray, k: int = 10
+    ) -> list[list[SearchResult]]:
+        """
+        Search for nearest neighbors of several queries at once.
+
+        Runs one knn_query over all queries and one SQLite fetch covering
+        every returned id.
+
+        Args:
+            query_vectors: Query embeddings, one per row
+            k: Number of results to return per query
 
-        # Can't return more than we have
-        k = min(k, current_count)
+        Returns:
+            One list of SearchResult objects per query, each sorted by distance (ascending)
+        """
+        if len(query_vectors) == 0:
+            return []
 
         with self._lock:
-            query = np.array([query_vector], dtype=np.float32)
-            labels, distances = self._index.knn_query(query, k=k)
+            # The index's own count needs no SQL query; it includes deleted
+            # rows, which are dropped below when their ids aren't found
+            current_count = self._index.get_current_count()
+            if current_count == 0:
+                return [[] for _ in range(len(query_vectors))]
 
-            row_ids = labels[0].tolist()
-            dists = distances[0].tolist()
+            # Can't return more than we have
+            k = min(k, current_count)
 
-        # Fetch from SQLite
-        results = []
+            queries = _normalize(np.asarray(query_vectors, dtype=np.float32))
+            labels, distances = self._index.knn_query(queries, k=k)
+
+        # Fetch every distinct row in one query
+        row_ids = list({int(label) for label in labels.ravel()})
+        placeholders = ",".join("?" * len(row_ids))
         with self._get_connection() as conn:
-            for row_id, distance in zip(row_ids, dists):
-                cursor = conn.execute(
-                    "SELECT doc_id, text, metadata, created_at FROM embeddings WHERE id = ?",
-                    (row_id,),
-                )
-                row = cursor.fetchone()
+            cursor = conn.execute(
+                f"SELECT id, doc_id, text, metadata, created_at FROM embeddings WHERE id IN ({placeholders})",
+                row_ids,
+            )
+            rows_by_id = {row[0]: row[1:] for row in cursor}
+
+        results = []
+        for query_labels, query_distances in zip(labels.tolist(), distances.tolist()):
+            query_results = []
+            for row_id, distance in zip(query_labels, query_distances):
+                row = rows_by_id.get(row_id)
                 if row:
-                    results.append(
+                    query_results.append(
                         SearchResult(
                             doc_id=row[0],
                             text=row[1],
-                            metadata=json.loads(row[2]) if row[2] else {},
+                            metadata=orjson.loads(row[2]) if row[2] else {},
                             created_at=row[3],
                             distance=distance,
                         )
                     )
+            results.append(query_results)
 
         return results
 
@@ -245,29 +394,114 @@ class Collection:
                 )
             else:
                 cursor = conn.execute(
-                    "SELECT doc_id, text, metadata, created_at FROM embeddings OFFSET ?",
+                    "SELECT doc_id, text, metadata, created_at FROM embeddings LIMIT -1 OFFSET ?",
                     (offset,),
                 )
 
             results = []
-            for row in cursor.fetchall():
+            for row in cursor:
                 results.append(
                     Embedding(
                         vector=[],  # Don't load vectors for efficiency
                         doc_id=row[0],
                         text=row[1],
-                        metadata=json.loads(row[2]) if row[2] else {},
+                        metadata=orjson.loads(row[2]) if row[2] else {},
                         created_at=row[3],
                     )
                 )
             return results
 
+    def unindexed(self) -> list[tuple[int, str]]:
+        """
+        Find rows whose vectors are missing from the index.
+
+        Rows commit before the deferred index save, so a crash can leave the
+        most recent ones out of the saved index.
+
+        Returns:
+            (row id, text) of each such row, to be re-embedded and passed
+            to add_vectors
+        """
+        with self._lock:
+            indexed = set(self._index.get_ids_list())
+        with self._get_connection() as conn:
+            cursor = conn.execute("SELECT id, text FROM embeddings ORDER BY id")
+            return [(row_id, text) for row_id, text in cursor if row_id not in indexed]
+
+    def add_vectors(self, row_ids: list[int], vectors: np.ndarray) -> None:
+        """Index vectors for rows already in the database, and save the index."""
+        if not row_ids:
+            return
+        vectors = _normalize(np.asarray(vectors, dtype=np.float32).reshape(len(row_ids), -1))
+        with self._lock:
+            self._resize_index_if_needed(max(row_ids))
+            self._index.add_items(vectors, row_ids)
+            self._save_index()
+
     def count(self) -> int:
         """Get the number of embeddings in the collection."""
         with self._get_connection() as conn:
             cursor = conn.execute("SELECT COUNT(*) FROM embeddings")
             return cursor.fetchone()[0]
 
+    def keyword_search(self, query: str, k: int = 10) -> list[SearchResult]:
+        """
+        Full-text search over embedding texts, ranked by BM25.
+
+        Any word of the query may match; documents matching more (and rarer)
+        words rank higher.
+
+        Args:
+            query: Free-text query
+            k: Number of results to return
+
+        Returns:
+            List of SearchResult objects whose distance is the BM25 score
+            (more negative = better match), best first
+        """
+        # Quote each word so punctuation in the query can't break FTS5 syntax
+        terms = re.findall(r"\w+", query)
+        if not terms:
+            return []
+        match = " OR ".join(f'"{term}"' for term in terms)
+
+        with self._get_connection() as conn:
+            cursor = conn.execute(
+                """
+                SELECT e.doc_id, e.text, e.metadata, e.created_at, bm25(embeddings_fts)
+                FROM embeddings_fts
+                JOIN embeddings e ON e.id = embeddings_fts.rowid
+                WHERE embeddings_fts MATCH ?
+                ORDER BY bm25(embeddings_fts)
+                LIMIT ?
+                """,
+                (match, k),
+            )
+            return [
+                SearchResult(
+                    doc_id=row[0],
+                    text=row[1],
+                    metadata=orjson.loads(row[2]) if row[2] else {},
+                    created_at=row[3],
+                    distance=row[4],
+                )
+                for row in cursor
+            ]
+
+    def unique_source_urls(self) -> list[str]:
+        """Get the distinct metadata source_url values, in first-seen order."""
+        with self._get_connection() as conn:
+            cursor = conn.execute(
+                """
+                SELECT json_extract(metadata, '$.source_url') AS url
+                FROM embeddings
+                WHERE url IS NOT NULL
+                GROUP BY url
+                ORDER BY MIN(id)
+                """
+            )
+            return [row[0] for row in cursor]
+
     def delete(self, doc_id: str) -> bool:
         """
         Delete an embedding by doc_id.
@@ -291,12 +525,8 @@ class Collection:
                 conn.execute("DELETE FROM embeddings")
                 conn.commit()
 
-            # Reinitialize index
-            self._index = hnswlib.Index(space="cosine", dim=self.dimension)
-            self._index.init_index(
-                max_elements=1000,
-                ef_construction=self.ef_construction,
-                M=self.M,
-            )
-            self._index.set_ef(self.ef_search)
-            self._index.save_index(str(self._index_path))
+            # Drop the index file rather than writing out an empty index;
+            # the next save after an add recreates it
+            self._index_path.unlink(missing_ok=True)
+            self._init_index()
+            self._unsaved = 0
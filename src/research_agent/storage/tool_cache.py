@@ -0,0 +1,80 @@
+"""Persistent cache of tool results, shared across agent runs."""
+
+import hashlib
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+
+class ToolResultCache:
+    """
+    A key-value cache of tool results backed by SQLite.
+
+    Entries are keyed on the SHA-256 of the tool name and canonical input,
+    and expire after a per-entry time-to-live.
+    """
+
+    def __init__(self, path: str | Path):
+        """
+        Initialize or load a cache.
+
+        Args:
+            path: Directory to store the cache database in
+        """
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._db_path = self.path / "tool_cache.db"
+        self._init_db()
+
+    def _init_db(self) -> None:
+        """Initialize SQLite database and drop expired entries."""
+        with sqlite3.connect(self._db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS tool_results (
+                    key TEXT PRIMARY KEY,
+                    result BLOB NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+            """)
+            conn.execute("DELETE FROM tool_results WHERE expires_at <= ?", (time.time(),))
+            conn.commit()
+
+    @staticmethod
+    def _key(tool_name: str, tool_input: dict) -> str:
+        """Hash a tool call into a cache key."""
+        payload = orjson.dumps([tool_name, tool_input], option=orjson.OPT_SORT_KEYS)
+        return hashlib.sha256(payload).hexdigest()
+
+    def get(self, tool_name: str, tool_input: dict) -> Any | None:
+        """
+        Look up the cached result of a tool call.
+
+        Returns:
+            The result, or None if missing or expired
+        """
+        with sqlite3.connect(self._db_path) as conn:
+            row = conn.execute(
+                "SELECT result FROM tool_results WHERE key = ? AND expires_at > ?",
+                (self._key(tool_name, tool_input), time.time()),
+            ).fetchone()
+        return orjson.loads(row[0]) if row else None
+
+    def set(self, tool_name: str, tool_input: dict, result: Any, ttl: float) -> None:
+        """
+        Store the result of a tool call.
+
+        Args:
+            tool_name: Name of the tool
+            tool_input: Input the tool was called with
+            result: JSON-serializable result
+            ttl: Seconds until the entry expires
+        """
+        with sqlite3.connect(self._db_path) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO tool_results (key, result, expires_at) VALUES (?, ?, ?)",
+                (self._key(tool_name, tool_input), orjson.dumps(result), time.time() + ttl),
+            )
+            conn.commit()
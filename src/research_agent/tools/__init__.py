@@ -1,6 +1,6 @@
 """Agent tools for browser automation and memory management."""
 
-from .browser import BrowserTool, SearchResult, PageContent
+from .browser import BrowserTool, Link, SearchResult, PageContent
 from .memory import MemoryTool
 
-__all__ = ["BrowserTool", "SearchResult", "PageContent", "MemoryTool"]
+__all__ = ["BrowserTool", "Link", "SearchResult", "PageContent", "MemoryTool"]
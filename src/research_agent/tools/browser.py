@@ -1,18 +1,58 @@
 """Playwright-based browser tool for web research."""
 
 import asyncio
+import importlib.util
 import re
-from dataclasses import dataclass
-from datetime import datetime
-from urllib.parse import quote_plus
-
-from playwright.async_api import Browser, Page, async_playwright
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from urllib.parse import parse_qsl, quote_plus, unquote, urlencode, urlsplit, urlunsplit
+
+import httpx
+from playwright.async_api import Browser, BrowserContext, Page, Route, async_playwright
 from playwright_stealth.stealth import Stealth
 
 from research_agent.config import Config
 
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+# Comprehensive headers, sent by the browser and the plain HTTP client
+REQUEST_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+}
+
+SEARCH_URL = "https://search.yahoo.com/search"
+
+# Fetched pages kept in memory (up to MAX_CONTENT_LENGTH chars each)
+PAGE_CACHE_SIZE = 1000
+
+# Query parameters that only track the visitor, ignored when matching URLs
+TRACKING_PARAMS = frozenset({"fbclid", "gclid", "dclid", "msclkid", "mc_cid", "mc_eid"})
+
+# Chromium disk cache size for the persistent profile (500 MB)
+DISK_CACHE_BYTES = 500 * 1024 * 1024
+
+# Resources that never affect extracted text. Stylesheets are still loaded,
+# since innerText depends on which elements CSS hides.
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+
+# After Yahoo rate-limits a plain HTTP search, search in the browser for this long
+HTTP_SEARCH_BACKOFF_S = 300.0
 
-@dataclass
+# How long to wait for a HEAD response before loading the page anyway
+HEAD_TIMEOUT_S = 5.0
+
+# How long to wait for a main content element once the DOM has loaded
+CONTENT_WAIT_MS = 1500
+
+
+@dataclass(slots=True)
 class SearchResult:
     """A single search result."""
 
@@ -21,63 +61,263 @@ class SearchResult:
     snippet: str
 
 
-@dataclass
+def _canonical_url(url: str) -> str:
+    """
+    Reduce a URL to a key shared by its trivially different spellings.
+
+    Lowercases the scheme and host, drops the fragment, tracking parameters
+    and any trailing slash, and sorts the remaining query parameters.
+    """
+    parts = urlsplit(url)
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in TRACKING_PARAMS
+    )
+    return urlunsplit((
+        parts.scheme.lower(),
+        parts.netloc.lower(),
+        parts.path.rstrip("/") or "/",
+        urlencode(query),
+        "",
+    ))
+
+
+def _unwrap_redirect(url: str) -> str:
+    """
+    Return the destination of a Yahoo click-tracking link, or `url` unchanged.
+
+    Result links point at r.search.yahoo.com with the target percent-encoded
+    in an `RU=` path segment.
+    """
+    parts = urlsplit(url)
+    if parts.netloc.lower().endswith("r.search.yahoo.com"):
+        for segment in parts.path.split("/"):
+            if segment.startswith("RU="):
+                return unquote(segment[3:])
+    return url
+
+
+class _SearchResultParser(HTMLParser):
+    """
+    Pull results out of Yahoo's server-rendered results page.
+
+    Mirrors the browser extraction: each `.algo` block yields the link in its
+    `h3` and the text of its `.compText` element.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.results: list[SearchResult] = []
+        self._depth = 0  # Div nesting inside the current .algo block; 0 outside
+        self._snippet_depth = 0  # Depth of the .compText div being read, if any
+        self._in_h3 = False
+        self._in_title = False
+        self._url = ""
+        self._title: list[str] = []
+        self._snippet: list[str] = []
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        classes = (dict(attrs).get("class") or "").split()
+        if tag == "div":
+            if self._depth:
+                self._depth += 1
+                if not self._snippet_depth and not self._snippet and "compText" in classes:
+                    self._snippet_depth = self._depth
+            elif "algo" in classes:
+                self._depth = 1
+        elif not self._depth:
+            return
+        elif tag == "h3":
+            self._in_h3 = True
+        elif tag == "a" and self._in_h3 and not self._url:
+            self._url = dict(attrs).get("href") or ""
+            self._in_title = True
+
+    def handle_endtag(self, tag: str) -> None:
+        if not self._depth:
+            return
+        if tag == "div":
+            if self._depth == self._snippet_depth:
+                self._snippet_depth = 0
+            self._depth -= 1
+            if not self._depth:
+                self._finish_result()
+        elif tag == "h3":
+            self._in_h3 = False
+        elif tag == "a":
+            self._in_title = False
+
+    def handle_data(self, data: str) -> None:
+        if self._in_title:
+            self._title.append(data)
+        elif self._snippet_depth:
+            self._snippet.append(data)
+
+    def _finish_result(self) -> None:
+        if self._url:
+            self.results.append(
+                SearchResult(
+                    title=" ".join("".join(self._title).split()),
+                    url=_unwrap_redirect(self._url),
+                    snippet=" ".join("".join(self._snippet).split()),
+                )
+            )
+        self._in_h3 = self._in_title = False
+        self._url = ""
+        self._title = []
+        self._snippet = []
+
+
+@dataclass(slots=True)
+class Link:
+    """A link found on a web page."""
+
+    text: str
+    href: str
+
+
+@dataclass(slots=True)
 class PageContent:
     """Extracted content from a web page."""
 
     url: str
     title: str
     text_content: str
-    links: list[dict[str, str]]  # [{"text": "...", "href": "..."}]
-    extraction_timestamp: str
+    links: list[Link]
+    extraction_timestamp: float = field(default_factory=time.time)  # Unix time
+    error: str | None = None  # Set when the page failed to load
 
 
 class BrowserTool:
     """Playwright-based browser tool for web research with parallel page support."""
 
-    def __init__(self, headless: bool | None = None, max_concurrent_pages: int = 4):
-        self._browser: Browser | None = None
+    def __init__(
+        self,
+        headless: bool | None = None,
+        max_concurrent_pages: int = 4,
+        block_resources: bool = True,
+    ):
+        self._browser: Browser | None = None  # Only launched when the profile is in use
+        self._context: BrowserContext | None = None
         self._playwright = None
+        self._http: httpx.AsyncClient | None = None  # For pages that need no browser
+        self._http_search_paused_until = 0.0  # Monotonic time; set when rate-limited
         self._headless = headless if headless is not None else Config.BROWSER_HEADLESS
         self._max_concurrent = max_concurrent_pages
-        self._semaphore: asyncio.Semaphore | None = None
-        self._page_cache: dict[str, PageContent] = {}  # URL -> cached content
-        self._url_locks: dict[str, asyncio.Lock] = {}  # Per-URL locks to prevent duplicate fetches
+        self._block_resources = block_resources  # Skip downloading BLOCKED_RESOURCE_TYPES
+        # Idle pages, or None for a slot whose page must be recreated; bounds concurrency
+        self._page_pool: asyncio.Queue[Page | None] | None = None
+        self._page_cache: OrderedDict[str, PageContent] = OrderedDict()  # Canonical URL -> content, LRU
+        # Per-URL locks to prevent duplicate fetches; dropped once no fetch holds them
+        self._url_locks: weakref.WeakValueDictionary[str, asyncio.Lock] = weakref.WeakValueDictionary()
 
     async def initialize(self) -> None:
         """Launch browser instance."""
-        if self._browser is not None:
+        if self._context is not None:
             return
 
+        self._http = httpx.AsyncClient(
+            headers=REQUEST_HEADERS,
+            follow_redirects=True,
+            timeout=Config.PAGE_TIMEOUT_MS / 1000,
+            # Multiplex requests to the same host over one connection when h2 is installed
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=16, keepalive_expiry=60),
+        )
         self._playwright = await async_playwright().start()
-        self._browser = await self._playwright.chromium.launch(headless=self._headless)
-        self._semaphore = asyncio.Semaphore(self._max_concurrent)
-
-    async def _create_page(self) -> Page:
-        """Create a new page with standard configuration and stealth techniques."""
-        page = await self._browser.new_page()
-
-        # Set realistic viewport
-        await page.set_viewport_size({"width": 1920, "height": 1080})
+        self._context = await self._create_context()
+        self._page_pool = asyncio.Queue()
+        for page in await asyncio.gather(
+            *(self._create_page() for _ in range(self._max_concurrent))
+        ):
+            self._page_pool.put_nowait(page)
+
+    async def _create_context(self) -> BrowserContext:
+        """
+        Create the context shared by every page, with standard configuration
+        and stealth techniques.
 
-        # Set comprehensive headers
-        await page.set_extra_http_headers({
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-        })
+        Sharing one context lets pages reuse its connections and cache, and
+        applies the configuration once rather than per page. The context
+        runs on a persistent profile, so its HTTP cache and cookies carry
+        over between runs.
+        """
+        options = {
+            # Set realistic viewport
+            "viewport": {"width": 1920, "height": 1080},
+            "extra_http_headers": REQUEST_HEADERS,
+        }
+        try:
+            Config.BROWSER_PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+            context = await self._playwright.chromium.launch_persistent_context(
+                Config.BROWSER_PROFILE_DIR,
+                headless=self._headless,
+                args=[f"--disk-cache-size={DISK_CACHE_BYTES}"],
+                **options,
+            )
+        except Exception:
+            # Another run holds the profile; use a throwaway context instead
+            self._browser = await self._playwright.chromium.launch(headless=self._headless)
+            context = await self._browser.new_context(**options)
 
         # Apply comprehensive stealth techniques using playwright-stealth
         stealth_config = Stealth(
             navigator_platform_override="MacIntel",  # Match our user agent
-            navigator_user_agent_override="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+            navigator_user_agent_override=USER_AGENT,
         )
-        await stealth_config.apply_stealth_async(page)
+        await stealth_config.apply_stealth_async(context)
+
+        if self._block_resources:
+            await context.route("**/*", self._route_request)
+
+        return context
 
-        return page
+    @staticmethod
+    async def _route_request(route: Route) -> None:
+        """Abort requests for resources that text extraction doesn't need."""
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def _create_page(self) -> Page:
+        """Open a new page in the shared context."""
+        return await self._context.new_page()
+
+    @asynccontextmanager
+    async def _acquire_page(self) -> AsyncIterator[Page]:
+        """Borrow an idle page from the pool, waiting if all are in use."""
+        page = await self._page_pool.get()
+        try:
+            if page is None:
+                # This slot's page was lost; open its replacement now
+                page = await self._create_page()
+            yield page
+        finally:
+            reusable = None  # Returned in place of a page that can't be reused
+            try:
+                if page is not None:
+                    # Unload the previous site before the page is reused
+                    await page.goto("about:blank")
+                    reusable = page
+            except Exception:
+                # Swap out pages that can no longer navigate
+                with suppress(Exception):
+                    await page.close()
+                with suppress(Exception):
+                    reusable = await self._create_page()
+            finally:
+                self._page_pool.put_nowait(reusable)
 
     async def close(self) -> None:
         """Close browser and cleanup."""
+        if self._http:
+            await self._http.aclose()
+            self._http = None
+        if self._context:
+            await self._context.close()
+            self._context = None
         if self._browser:
             await self._browser.close()
             self._browser = None
@@ -98,6 +338,10 @@ class BrowserTool:
         """
         Execute web search using Yahoo and return results.
 
+        Tries Yahoo's server-rendered results page over plain HTTP first, and
+        only loads it in the browser if that yields nothing (e.g. a consent
+        redirect).
+
         Args:
             query: Search query
             num_results: Number of results to return
@@ -105,15 +349,18 @@ class BrowserTool:
         Returns:
             List of SearchResult objects
         """
-        if not self._browser:
+        if not self._context:
             await self.initialize()
 
-        async with self._semaphore:
-            page = await self._create_page()
+        results = await self._http_search(query)
+        if results:
+            return results[:num_results]
+
+        async with self._acquire_page() as page:
             try:
                 # Build Yahoo search URL
                 encoded_query = quote_plus(query)
-                search_url = f"https://search.yahoo.com/search?p={encoded_query}"
+                search_url = f"{SEARCH_URL}?p={encoded_query}"
 
                 await page.goto(search_url, timeout=Config.PAGE_TIMEOUT_MS)
 
@@ -173,7 +420,7 @@ class BrowserTool:
 
                 return [
                     SearchResult(
-                        title=r["title"], url=r["url"], snippet=r["snippet"]
+                        title=r["title"], url=_unwrap_redirect(r["url"]), snippet=r["snippet"]
                     )
                     for r in results[:num_results]
                 ]
@@ -181,8 +428,67 @@ class BrowserTool:
             except Exception as e:
                 # Return empty results on error
                 return []
-            finally:
-                await page.close()
+
+    async def _http_search(self, query: str) -> list[SearchResult]:
+        """
+        Fetch and parse Yahoo results without the browser.
+
+        Returns:
+            List of SearchResult objects, empty if the request or parse fails
+        """
+        if time.monotonic() < self._http_search_paused_until:
+            return []
+
+        try:
+            response = await self._http.get(SEARCH_URL, params={"p": query})
+        except httpx.HTTPError:
+            return []
+        if response.status_code in (429, 503):
+            # Back off rather than keep hitting the limit
+            self._http_search_paused_until = time.monotonic() + HTTP_SEARCH_BACKOFF_S
+            return []
+        if response.is_error:
+            return []
+
+        parser = _SearchResultParser()
+        parser.feed(response.text)
+        parser.close()
+
+        # Skip duplicates and Yahoo internal links, as the browser path does
+        seen = set()
+        results = []
+        for result in parser.results:
+            if "yahoo.com/search" in result.url or result.url in seen:
+                continue
+            seen.add(result.url)
+            results.append(result)
+        return results
+
+    async def _check_loadable(self, url: str) -> str | None:
+        """
+        Ask the server what a URL holds before loading it in the browser.
+
+        Returns:
+            Why the page should be skipped, or None to load it. Servers that
+            don't answer HEAD, or leave out the headers, get the benefit of
+            the doubt.
+        """
+        try:
+            response = await self._http.head(url, timeout=HEAD_TIMEOUT_S)
+        except httpx.HTTPError:
+            return None
+        if response.is_error:
+            return None
+
+        content_type = response.headers.get("Content-Type", "").lower()
+        if content_type and not ("html" in content_type or content_type.startswith("text/")):
+            return f"content type {content_type.split(';')[0]} is not a web page"
+
+        content_length = response.headers.get("Content-Length", "")
+        if content_length.isdigit() and int(content_length) > Config.MAX_DOWNLOAD_BYTES:
+            return f"{int(content_length) // (1024 * 1024)} MB is over the download limit"
+
+        return None
 
     async def get_page_content(
         self,
@@ -195,46 +501,66 @@ class BrowserTool:
 
         Args:
             url: Full URL to visit
-            wait_for_js: Wait for JavaScript to render
+            wait_for_js: Briefly wait for a main content element to render
             timeout_ms: Custom timeout in milliseconds
 
         Returns:
             PageContent with extracted text and metadata
         """
+        # Spellings of the same page share cache entries and locks
+        key = _canonical_url(url)
+
         # Check cache first (fast path, no lock needed)
-        if url in self._page_cache:
-            return self._page_cache[url]
+        if key in self._page_cache:
+            self._page_cache.move_to_end(key)
+            return self._page_cache[key]
 
         # Get or create a lock for this URL to prevent duplicate fetches
-        if url not in self._url_locks:
-            self._url_locks[url] = asyncio.Lock()
+        lock = self._url_locks.get(key)
+        if lock is None:
+            lock = self._url_locks[key] = asyncio.Lock()
 
-        async with self._url_locks[url]:
+        async with lock:
             # Check cache again (another request may have populated it while we waited)
-            if url in self._page_cache:
-                return self._page_cache[url]
+            if key in self._page_cache:
+                self._page_cache.move_to_end(key)
+                return self._page_cache[key]
 
-            if not self._browser:
+            if not self._context:
                 await self.initialize()
 
+            skip_reason = await self._check_loadable(url)
+            if skip_reason:
+                return PageContent(
+                    url=url,
+                    title="Unsupported content",
+                    text_content=f"Skipped page: {skip_reason}",
+                    links=[],
+                    error=skip_reason,
+                )
+
             timeout = timeout_ms or Config.PAGE_TIMEOUT_MS
 
-            async with self._semaphore:
-                page = await self._create_page()
+            async with self._acquire_page() as page:
                 try:
-                    await page.goto(url, timeout=timeout)
+                    await page.goto(url, timeout=timeout, wait_until="domcontentloaded")
 
                     if wait_for_js:
-                        # Wait for content to stabilize
-                        await page.wait_for_load_state("networkidle", timeout=timeout)
-
-                    # Extract title
-                    title = await page.title()
-
-                    # Extract main text content
-                    text_content = await page.evaluate(
+                        try:
+                            await page.wait_for_selector(
+                                'main, article, [role="main"]', timeout=CONTENT_WAIT_MS
+                            )
+                        except Exception:
+                            # No content element rendered in time; extraction
+                            # falls back to whatever is in document.body
+                            pass
+
+                    # Extract title, main text and links in one round-trip
+                    extracted = await page.evaluate(
                         """
-                        () => {
+                        (maxLength) => {
+                            const title = document.title;
+
                             // Remove script and style elements
                             const scripts = document.querySelectorAll('script, style, noscript, nav, footer, header');
                             scripts.forEach(el => el.remove());
@@ -257,19 +583,11 @@ class BrowserTool:
                             // Clean up whitespace
                             text = text.replace(/\\s+/g, ' ').trim();
 
-                            return text;
-                        }
-                    """
-                    )
-
-                    # Truncate if too long
-                    if len(text_content) > Config.MAX_CONTENT_LENGTH:
-                        text_content = text_content[: Config.MAX_CONTENT_LENGTH] + "... [truncated]"
+                            // Truncate here so long pages aren't sent over in full
+                            if (text.length > maxLength) {
+                                text = text.slice(0, maxLength) + '... [truncated]';
+                            }
 
-                    # Extract links
-                    links = await page.evaluate(
-                        """
-                        () => {
                             const links = [];
                             const anchors = document.querySelectorAll('a[href^="http"]');
 
@@ -280,22 +598,28 @@ class BrowserTool:
                                         href: a.href
                                     });
                                 }
+                                if (links.length >= 50) break;  // Limit to 50 links
                             }
 
-                            return links.slice(0, 50);  // Limit to 50 links
+                            return {title, text, links};
                         }
-                    """
+                    """,
+                        Config.MAX_CONTENT_LENGTH,
                     )
+                    title = extracted["title"]
+                    text_content = extracted["text"]
+                    links = [Link(link["text"], link["href"]) for link in extracted["links"]]
 
                     result = PageContent(
                         url=url,
                         title=title,
                         text_content=text_content,
                         links=links,
-                        extraction_timestamp=datetime.utcnow().isoformat(),
                     )
                     # Cache successful fetches
-                    self._page_cache[url] = result
+                    self._page_cache[key] = result
+                    if len(self._page_cache) > PAGE_CACHE_SIZE:
+                        self._page_cache.popitem(last=False)
                     return result
 
                 except Exception as e:
@@ -305,7 +629,5 @@ class BrowserTool:
                         title="Error loading page",
                         text_content=f"Failed to load page: {str(e)}",
                         links=[],
-                        extraction_timestamp=datetime.utcnow().isoformat(),
+                        error=str(e),
                     )
-                finally:
-                    await page.close()
@@ -1,11 +1,16 @@
 """Async queue for background finding storage."""
 
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 from rich.console import Console
 
-from research_agent.tools.memory import MemoryTool
+from research_agent.models.findings import Citation, Finding
+
+if TYPE_CHECKING:
+    from research_agent.tools.memory import MemoryTool
 
 console = Console()
 
@@ -22,38 +27,78 @@ class StorageTask:
     author: str | None = None
     publication_date: str | None = None
 
+    def to_finding(self) -> Finding:
+        """Build the Finding this task will store."""
+        return Finding(
+            text=self.text,
+            citation=Citation(
+                source_url=self.source_url,
+                title=self.title,
+                author=self.author,
+                publication_date=self.publication_date,
+            ),
+            relevance_notes=self.relevance_notes,
+            finding_type=self.finding_type,
+        )
+
 
 class FindingQueue:
     """
     Async queue for storing findings in the background.
 
     Validation (e.g., direct quote checking) happens synchronously before queueing.
-    The actual storage (embedding generation + write) happens asynchronously.
+    The actual storage (embedding generation + write) happens asynchronously, in
+    batches: each worker collects up to `max_batch` findings, waiting at most
+    `linger` seconds for more to arrive, and embeds each batch in one pass.
+    Workers share one queue; more than one only helps if the embedder can
+    run several batches at once. Batches are stored on a dedicated thread
+    per worker, so storage neither waits on nor blocks other threaded work.
     """
 
-    def __init__(self, memory_tool: MemoryTool):
+    def __init__(
+        self,
+        memory_tool: "MemoryTool",
+        max_batch: int = 16,
+        linger: float = 0.1,
+        num_workers: int = 1,
+    ):
         self._memory = memory_tool
+        self._max_batch = max_batch
+        self._linger = linger
+        self._num_workers = num_workers
         self._queue: asyncio.Queue[StorageTask | None] = asyncio.Queue()
-        self._worker_task: asyncio.Task | None = None
+        self._worker_tasks: list[asyncio.Task] = []
+        self._executor: ThreadPoolExecutor | None = None
         self._stored_count = 0
         self._failed_count = 0
         self._errors: list[str] = []
 
     async def start(self) -> None:
-        """Start the background worker."""
-        self._worker_task = asyncio.create_task(self._worker())
+        """Start the background workers."""
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._num_workers, thread_name_prefix="finding-store"
+        )
+        self._worker_tasks = [
+            asyncio.create_task(self._worker()) for _ in range(self._num_workers)
+        ]
 
     async def drain(self) -> None:
         """Wait for all queued items to be processed."""
         await self._queue.join()
 
     async def stop(self) -> None:
-        """Stop worker after draining the queue."""
+        """Stop workers after draining the queue. Does nothing if not running."""
+        if self._executor is None:
+            return
         await self.drain()
-        # Send sentinel to stop the worker gracefully
-        await self._queue.put(None)
-        if self._worker_task:
-            await self._worker_task
+        # Send one sentinel per worker to stop them gracefully
+        for _ in self._worker_tasks:
+            await self._queue.put(None)
+        await asyncio.gather(*self._worker_tasks)
+        self._worker_tasks = []
+        # Every batch has finished, so this returns immediately
+        self._executor.shutdown(wait=True)
+        self._executor = None
 
     def enqueue(self, task: StorageTask) -> None:
         """Add a finding to the storage queue (non-blocking)."""
@@ -79,35 +124,68 @@ class FindingQueue:
         """List of error messages from failed storage attempts."""
         return self._errors.copy()
 
-    async def _worker(self) -> None:
-        """Background worker that processes storage tasks."""
+    async def _next_batch(self) -> tuple[list[StorageTask], bool]:
+        """
+        Wait for a task, then collect any more that arrive within the linger window.
+
+        Returns:
+            The batch, and whether the stop sentinel was received
+        """
+        batch: list[StorageTask] = []
+        task = await self._queue.get()
         while True:
-            try:
-                task = await self._queue.get()
+            if task is None:
+                self._queue.task_done()
+                return batch, True
 
-                if task is None:
-                    self._queue.task_done()
-                    break
+            batch.append(task)
+            if len(batch) >= self._max_batch:
+                return batch, False
+
+            try:
+                task = await asyncio.wait_for(self._queue.get(), timeout=self._linger)
+            except asyncio.TimeoutError:
+                return batch, False
+
+    async def _store_batch(self, batch: list[StorageTask]) -> None:
+        """Store a batch of tasks with one embedding pass and one write."""
+        try:
+            findings = []
+            for task in batch:
+                try:
+                    findings.append(task.to_finding())
+                except Exception as e:
+                    self._record_failure(e)
 
+            if findings:
                 try:
-                    # Run blocking storage in thread pool
-                    await asyncio.to_thread(
-                        self._memory.store_finding_from_dict,
-                        text=task.text,
-                        source_url=task.source_url,
-                        title=task.title,
-                        relevance_notes=task.relevance_notes,
-                        finding_type=task.finding_type,
-                        author=task.author,
-                        publication_date=task.publication_date,
+                    # Run blocking storage in the storage threads
+                    loop = asyncio.get_running_loop()
+                    await loop.run_in_executor(
+                        self._executor, self._memory.store_findings, findings
                     )
-                    self._stored_count += 1
+                    self._stored_count += len(findings)
                 except Exception as e:
-                    self._failed_count += 1
-                    self._errors.append(f"Failed to store finding: {e}")
-                    console.print(f"  [red]Queue error: {e}[/red]")
-                finally:
-                    self._queue.task_done()
+                    self._record_failure(e, count=len(findings))
+        finally:
+            for _ in batch:
+                self._queue.task_done()
+
+    def _record_failure(self, error: Exception, count: int = 1) -> None:
+        """Count findings that failed to store and report the error."""
+        self._failed_count += count
+        self._errors.append(f"Failed to store finding: {error}")
+        console.print(f"  [red]Queue error: {error}[/red]")
+
+    async def _worker(self) -> None:
+        """Background worker that processes storage tasks in batches."""
+        while True:
+            try:
+                batch, stopping = await self._next_batch()
+                if batch:
+                    await self._store_batch(batch)
+                if stopping:
+                    break
 
             except asyncio.CancelledError:
                 break
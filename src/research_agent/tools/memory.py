@@ -1,7 +1,9 @@
 """Vector-based memory store for research findings."""
 
 import re
+from collections.abc import Iterable
 from datetime import datetime
+from heapq import nlargest
 from pathlib import Path
 from uuid import uuid4
 
@@ -10,6 +12,12 @@ from research_agent.embeddings import QwenEmbedder
 from research_agent.models.findings import Citation, Finding, FindingType
 from research_agent.storage import Collection, Embedding
 
+# Reciprocal rank fusion constant; dampens the weight of top ranks
+RRF_K = 60
+
+# Runs of characters not allowed in store names
+SLUG_RE = re.compile(r"[^a-z0-9]+")
+
 
 class MemoryTool:
     """Vector-based memory store for research findings."""
@@ -25,6 +33,7 @@ class MemoryTool:
         self._storage_dir = Path(storage_dir or Config.KNOWLEDGE_STORE_DIR)
         self._collection: Collection | None = None
         self._source_urls: set[str] = set()
+        self._normalized_source_urls: set[str] = set()  # For has_source lookups
 
     @property
     def store_path(self) -> Path:
@@ -41,23 +50,34 @@ class MemoryTool:
             name=self._store_name,
             dimension=self._embedder.dimension,
             path=self._storage_dir,
+            ef_construction=Config.HNSW_EF_CONSTRUCTION,
+            M=Config.HNSW_M,
+            ef_search=Config.HNSW_EF_SEARCH,
         )
 
+        # Recover vectors lost by a crash before the index was saved
+        self._reindex_missing()
+
         # Load existing source URLs
         self._load_source_urls()
 
+    def _reindex_missing(self) -> None:
+        """Re-embed and index stored findings that are missing from the vector index."""
+        missing = self._collection.unindexed()
+        if not missing:
+            return
+        row_ids, texts = zip(*missing)
+        vectors = self._embedder.embed_batch(list(texts))
+        self._collection.add_vectors(list(row_ids), vectors)
+
     def _load_source_urls(self) -> None:
         """Load source URLs from existing findings."""
         if self._collection is None:
             return
 
         try:
-            count = self._collection.count()
-            if count > 0:
-                embeddings = self._collection.get_all(limit=count)
-                for emb in embeddings:
-                    if emb.metadata and "source_url" in emb.metadata:
-                        self._source_urls.add(emb.metadata["source_url"])
+            # Aggregated in SQLite, without loading every finding
+            self._add_source_urls(self._collection.unique_source_urls())
         except Exception:
             pass
 
@@ -94,10 +114,46 @@ class MemoryTool:
         self._collection.add(embedding)
 
         # Track source URL
-        self._source_urls.add(finding.citation.source_url)
+        self._add_source_urls([finding.citation.source_url])
 
         return doc_id
 
+    def store_findings(self, findings: list[Finding]) -> list[str]:
+        """
+        Store several research findings with one embedding pass and one write.
+
+        Args:
+            findings: The Finding objects to store
+
+        Returns:
+            The document IDs, in the same order as `findings`
+        """
+        if not findings:
+            return []
+
+        if self._collection is None:
+            self.initialize()
+
+        # Generate all embeddings in a single batched forward pass
+        embedding_vectors = self._embedder.embed([finding.text for finding in findings])
+
+        embeddings = [
+            Embedding(
+                vector=vector,
+                text=finding.text,
+                doc_id=str(uuid4()),
+                metadata=finding.to_storage_dict(),
+            )
+            for finding, vector in zip(findings, embedding_vectors)
+        ]
+
+        self._collection.add_batch(embeddings)
+
+        # Track source URLs
+        self._add_source_urls(finding.citation.source_url for finding in findings)
+
+        return [embedding.doc_id for embedding in embeddings]
+
     def store_finding_from_dict(
         self,
         text: str,
@@ -138,38 +194,66 @@ class MemoryTool:
 
     def search_findings(
         self, query: str, k: int = 10
-    ) -> list[tuple[Finding, float]]:
+    ) -> list[tuple[Finding, float | None, str]]:
         """
-        Semantic search for relevant findings.
+        Hybrid semantic + keyword search for relevant findings.
+
+        Runs a vector search and a BM25 full-text search and merges the two
+        rankings with reciprocal rank fusion, so exact names, URLs and quoted
+        phrases are found even when they are not semantically close.
 
         Args:
-            query: Semantic search query
+            query: Search query
             k: Number of results to return
 
         Returns:
-            List of (Finding, distance) tuples. Lower distance = more similar.
+            List of (Finding, distance, match_type) tuples, best first.
+            distance is the vector distance (lower = more similar), or None
+            for keyword-only matches. match_type is "vector", "keyword" or "both".
         """
         if self._collection is None:
             self.initialize()
 
-        # Generate query embedding
+        # Generate query embedding (cached by the embedder for repeated queries)
         query_vector = self._embedder.embed_single(query, is_query=True)
 
-        # Search
-        results = self._collection.search(query_vector, k=k)
+        # Search both indices
+        vector_results = self._collection.search(query_vector, k=k)
+        keyword_results = self._collection.keyword_search(query, k=k)
+
+        # Reciprocal rank fusion: score = sum of 1 / (RRF_K + rank)
+        scores: dict[str, float] = {}
+        results_by_id = {}
+        distances: dict[str, float] = {}
+        match_types: dict[str, str] = {}
+        for rank, result in enumerate(vector_results, start=1):
+            scores[result.doc_id] = scores.get(result.doc_id, 0.0) + 1 / (RRF_K + rank)
+            results_by_id[result.doc_id] = result
+            distances[result.doc_id] = result.distance
+            match_types[result.doc_id] = "vector"
+        for rank, result in enumerate(keyword_results, start=1):
+            scores[result.doc_id] = scores.get(result.doc_id, 0.0) + 1 / (RRF_K + rank)
+            results_by_id.setdefault(result.doc_id, result)
+            match_types[result.doc_id] = "both" if result.doc_id in distances else "keyword"
 
         # Convert to Findings
         findings = []
-        for result in results:
+        for doc_id in nlargest(k, scores, key=scores.__getitem__):
+            result = results_by_id[doc_id]
             finding = Finding.from_storage(
                 text=result.text,
                 metadata=result.metadata or {},
                 doc_id=result.doc_id,
             )
-            findings.append((finding, result.distance))
+            findings.append((finding, distances.get(doc_id), match_types[doc_id]))
 
         return findings
 
+    def flush(self) -> None:
+        """Write stored findings' vectors to disk; call when done storing."""
+        if self._collection is not None:
+            self._collection.flush()
+
     def get_all_findings(self) -> list[Finding]:
         """Retrieve all stored findings for final document generation."""
         if self._collection is None:
@@ -207,14 +291,20 @@ class MemoryTool:
             "store_path": str(self.store_path),
         }
 
+    @staticmethod
+    def _normalize_url(url: str) -> str:
+        """Normalize a URL for comparison."""
+        return url.rstrip("/").lower()
+
+    def _add_source_urls(self, urls: Iterable[str]) -> None:
+        """Record source URLs, keeping the normalized set in step."""
+        for url in urls:
+            self._source_urls.add(url)
+            self._normalized_source_urls.add(self._normalize_url(url))
+
     def has_source(self, url: str) -> bool:
         """Check if a source URL has already been processed."""
-        # Normalize URL for comparison
-        normalized = url.rstrip("/").lower()
-        for existing in self._source_urls:
-            if existing.rstrip("/").lower() == normalized:
-                return True
-        return False
+        return self._normalize_url(url) in self._normalized_source_urls
 
 
 def generate_store_name(topic: str, detail_level: str) -> str:
@@ -229,7 +319,7 @@ def generate_store_name(topic: str, detail_level: str) -> str:
         Store name like "quantum_computing_20250117_143052_comprehensive"
     """
     # Slugify topic
-    slug = re.sub(r"[^a-z0-9]+", "_", topic.lower())
+    slug = SLUG_RE.sub("_", topic.lower())
     slug = slug.strip("_")[:50]  # Limit length
 
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
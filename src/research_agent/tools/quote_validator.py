@@ -1,9 +1,18 @@
 """Validation for direct quotes against source content."""
 
 import re
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
+from functools import lru_cache
 
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
+
+# Compiled once; normalize_text runs on every quote and every candidate window
+WHITESPACE_RE = re.compile(r'\s+')
+
+# Quotes up to this many words are compared against every window of the
+# source rather than only around their best character alignment
+SHORT_QUOTE_WORDS = 8
 
 
 @dataclass
@@ -19,11 +28,49 @@ class QuoteValidationResult:
 def normalize_text(text: str) -> str:
     """Normalize text for comparison (collapse whitespace, lowercase)."""
     # Collapse all whitespace to single spaces
-    text = re.sub(r'\s+', ' ', text)
+    text = WHITESPACE_RE.sub(' ', text)
     # Strip and lowercase
     return text.strip().lower()
 
 
+@dataclass(slots=True)
+class PreparedSource:
+    """A source text split into words, ready for matching quotes against."""
+
+    words: list[str]  # Original words, preserving formatting
+    text: str  # Words lowercased and joined by single spaces
+    word_starts: list[int]  # Character span of each word in `text`
+    word_ends: list[int]
+
+    def span_text(self, start: int, end: int) -> str:
+        """The normalized text of words [start, end)."""
+        return self.text[self.word_starts[start]:self.word_ends[end - 1]]
+
+
+@lru_cache(maxsize=128)
+def prepare_source(source_text: str) -> PreparedSource:
+    """
+    Split and normalize a source text, once per distinct text.
+
+    Several quotes are usually validated against the same page, whose text
+    comes back from the browser's page cache.
+    """
+    words = source_text.split()
+    # Offsets are taken from the lowercased words: lowercasing can change a
+    # word's length (e.g. 'İ' becomes two code points)
+    lowered = [word.lower() for word in words]
+    word_starts = []
+    word_ends = []
+    offset = 0
+    for word in lowered:
+        word_starts.append(offset)
+        offset += len(word)
+        word_ends.append(offset)
+        offset += 1
+    # Same result as normalize_text, which collapses the same whitespace
+    return PreparedSource(words, ' '.join(lowered), word_starts, word_ends)
+
+
 def find_exact_match(quote: str, source_text: str) -> str | None:
     """
     Find an exact match of the quote in the source text.
@@ -31,29 +78,35 @@ def find_exact_match(quote: str, source_text: str) -> str | None:
     Returns the matched text from the source (preserving original formatting)
     or None if not found.
     """
-    normalized_quote = normalize_text(quote)
-    normalized_source = normalize_text(source_text)
-
-    if normalized_quote in normalized_source:
-        # Find the position in normalized source
-        start_idx = normalized_source.find(normalized_quote)
-
-        # Map back to original source to preserve formatting
-        # This is approximate - we find a window in the original text
-        # that matches the normalized length
-        original_words = source_text.split()
-        normalized_words = normalized_quote.split()
-
-        # Try to find the starting word
-        for i in range(len(original_words) - len(normalized_words) + 1):
-            window = ' '.join(original_words[i:i + len(normalized_words)])
-            if normalize_text(window) == normalized_quote:
-                return window
-
-        # Fallback: return the quote as-is since we confirmed it exists
+    # Verbatim copies are the common case and need no normalization
+    if quote.strip() and quote in source_text:
         return quote
 
-    return None
+    normalized_quote = normalize_text(quote)
+    if not normalized_quote:
+        return None
+    source = prepare_source(source_text)
+
+    start_idx = source.text.find(normalized_quote)
+    if start_idx == -1:
+        return None
+
+    # Map back to original source to preserve formatting: use the first
+    # occurrence that starts and ends on word boundaries
+    quote_word_count = len(normalized_quote.split())
+    while start_idx != -1:
+        first_word = bisect_left(source.word_starts, start_idx)
+        end_word = first_word + quote_word_count
+        if (
+            end_word <= len(source.words)
+            and source.word_starts[first_word] == start_idx
+            and source.word_ends[end_word - 1] == start_idx + len(normalized_quote)
+        ):
+            return ' '.join(source.words[first_word:end_word])
+        start_idx = source.text.find(normalized_quote, start_idx + 1)
+
+    # Fallback: return the quote as-is since we confirmed it exists
+    return quote
 
 
 def find_fuzzy_match(
@@ -64,52 +117,55 @@ def find_fuzzy_match(
     """
     Find a fuzzy match of the quote in the source text.
 
-    Uses a sliding window approach to find the best matching substring.
-    Uses RapidFuzz (C++ implementation) for fast fuzzy matching.
+    Longer quotes are located with RapidFuzz's partial_ratio_alignment
+    (C++ implementation) in a single call, then the whole-word window around
+    that spot that best matches the quote is picked. Short quotes are scored
+    against every whole-word window of similar length.
 
     Returns:
         Tuple of (matched_text, match_ratio) or (None, 0.0) if no match above threshold.
     """
     normalized_quote = normalize_text(quote)
-    quote_words = normalized_quote.split()
-    quote_word_count = len(quote_words)
-
-    if quote_word_count == 0:
+    if not normalized_quote:
         return None, 0.0
 
-    # Split source into words, preserving original text for extraction
-    source_words_original = source_text.split()
-    source_words_normalized = [w.lower() for w in source_words_original]
-
-    best_match = None
-    best_ratio = 0.0
-    best_start = 0
-    best_end = 0
-
-    # Sliding window with varying sizes (allow some flexibility in length)
-    min_window = max(1, quote_word_count - 5)
-    max_window = quote_word_count + 5
-
-    for window_size in range(min_window, min(max_window + 1, len(source_words_original) + 1)):
-        for i in range(len(source_words_original) - window_size + 1):
-            window_normalized = ' '.join(source_words_normalized[i:i + window_size])
-
-            # Use RapidFuzz for fast similarity (returns 0-100, convert to 0-1)
-            ratio = fuzz.ratio(normalized_quote, window_normalized) / 100.0
-
-            if ratio > best_ratio:
-                best_ratio = ratio
-                best_start = i
-                best_end = i + window_size
+    source = prepare_source(source_text)
+    if not source.words:
+        return None, 0.0
 
-                # Early termination if we find a very good match
-                if ratio >= 0.98:
-                    best_match = ' '.join(source_words_original[best_start:best_end])
-                    return best_match, best_ratio
+    word_count = len(source.words)
+    quote_word_count = normalized_quote.count(' ') + 1
+    if quote_word_count <= SHORT_QUOTE_WORDS:
+        # A short quote can align perfectly inside unrelated longer words,
+        # so score every whole-word window of about its length instead
+        spans = [
+            (start, start + size)
+            for size in range(max(1, min(quote_word_count - 2, word_count)), quote_word_count + 3)
+            for start in range(word_count - size + 1)
+        ]
+    else:
+        # Locate the best matching stretch of characters in one native call
+        alignment = fuzz.partial_ratio_alignment(normalized_quote, source.text)
+        first_word = bisect_right(source.word_starts, alignment.dest_start) - 1
+        last_word = bisect_left(source.word_starts, alignment.dest_end)
+
+        # The alignment can start or end mid-word, so score the whole-word
+        # windows around it
+        spans = [
+            (start, end)
+            for start in range(max(0, first_word - 2), min(first_word + 3, word_count))
+            for end in range(max(start + 1, last_word - 2), min(last_word + 3, word_count + 1))
+        ]
+    windows = [source.span_text(start, end) for start, end in spans]
+    # Score all windows in one batched call (returns 0-100, convert to 0-1)
+    scores = process.cdist([normalized_quote], windows, scorer=fuzz.ratio, dtype=float)[0]
+    best = int(scores.argmax())
+    best_ratio = float(scores[best]) / 100.0
+    best_start, best_end = spans[best]
 
     if best_ratio >= min_ratio:
         # Extract the original text (preserving formatting)
-        best_match = ' '.join(source_words_original[best_start:best_end])
+        best_match = ' '.join(source.words[best_start:best_end])
         return best_match, best_ratio
 
     return None, best_ratio
@@ -143,6 +199,12 @@ async def validate_direct_quote(
             error=f"Failed to fetch source URL: {e}"
         )
 
+    if page_content.error:
+        return QuoteValidationResult(
+            valid=False,
+            error=f"Failed to fetch source URL: {page_content.error}"
+        )
+
     if not source_text or len(source_text.strip()) < 10:
         return QuoteValidationResult(
             valid=False,
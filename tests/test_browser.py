@@ -4,9 +4,13 @@ import asyncio
 import sys
 from pathlib import Path
 
+import httpx
+
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+SERP_FIXTURE = Path(__file__).parent / "fixtures" / "yahoo_search.html"
+
 
 class TestBrowserTool:
     """Tests for BrowserTool."""
@@ -41,6 +45,107 @@ class TestBrowserTool:
             assert len(content.text_content) > 0, "Expected page to have content"
 
 
+class TestSearchResultParser:
+    """Tests for parsing a saved Yahoo results page."""
+
+    def test_extracts_results(self):
+        """Test that titles, unwrapped URLs and snippets come from each result block."""
+        from research_agent.tools.browser import _SearchResultParser
+
+        parser = _SearchResultParser()
+        parser.feed(SERP_FIXTURE.read_text())
+        parser.close()
+
+        assert [(r.title, r.url) for r in parser.results] == [
+            ("Welcome to Python.org", "https://www.python.org/about/gettingstarted/?lang=en"),
+            (
+                "Python (programming language) - Wikipedia",
+                "https://en.wikipedia.org/wiki/Python_(programming_language)",
+            ),
+            ("Searches related to python", "https://search.yahoo.com/search?p=python+tutorial&fr=sfp"),
+            ("Getting started with Python", "https://www.python.org/about/gettingstarted/?lang=en"),
+        ]
+        assert parser.results[0].snippet == "The official home of the Python Programming Language."
+        # Only the first .compText block, including its nested elements
+        assert parser.results[1].snippet == (
+            "Python is a high-level, general-purpose programming language. "
+            "Its design philosophy emphasizes code readability."
+        )
+
+    def test_unwrap_redirect(self):
+        """Test that only Yahoo click-tracking links are unwrapped."""
+        from research_agent.tools.browser import _unwrap_redirect
+
+        assert _unwrap_redirect(
+            "https://r.search.yahoo.com/_ylt=A/RV=2/RU=https%3a%2f%2fexample.com%2fa%3fb%3d1/RK=2/RS=x-"
+        ) == "https://example.com/a?b=1"
+        assert _unwrap_redirect("https://example.com/RU=x") == "https://example.com/RU=x"
+
+
+class TestHttpSearch:
+    """Tests for searching over plain HTTP."""
+
+    @staticmethod
+    def search(handler, times: int = 1):
+        """Run `times` HTTP searches against a mocked server."""
+        from research_agent.tools.browser import BrowserTool
+
+        async def run():
+            browser = BrowserTool()
+            browser._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            try:
+                return [await browser._http_search("python programming") for _ in range(times)]
+            finally:
+                await browser._http.aclose()
+
+        return asyncio.run(run())
+
+    def test_skips_internal_and_duplicate_links(self):
+        """Test that Yahoo's own links and repeated URLs are dropped."""
+        [results] = self.search(lambda request: httpx.Response(200, text=SERP_FIXTURE.read_text()))
+
+        assert [r.url for r in results] == [
+            "https://www.python.org/about/gettingstarted/?lang=en",
+            "https://en.wikipedia.org/wiki/Python_(programming_language)",
+        ]
+
+    def test_backs_off_when_rate_limited(self):
+        """Test that a 429 pauses HTTP search instead of retrying right away."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(429)
+
+        assert self.search(handler, times=2) == [[], []]
+        assert len(requests) == 1
+
+
+class TestSkippedPages:
+    """Tests for pages skipped after a HEAD check."""
+
+    def test_skipped_page_reports_error(self):
+        """Test that a non-HTML URL comes back as an error without loading it."""
+        from research_agent.tools.browser import BrowserTool
+
+        def handler(request):
+            assert request.method == "HEAD"
+            return httpx.Response(200, headers={"content-type": "application/pdf"})
+
+        async def run():
+            browser = BrowserTool()
+            browser._context = object()  # Never used: the page is skipped first
+            browser._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            try:
+                return await browser.get_page_content("https://example.com/paper.pdf")
+            finally:
+                await browser._http.aclose()
+
+        content = asyncio.run(run())
+
+        assert content.error == "content type application/pdf is not a web page"
+
+
 # Quick manual test
 if __name__ == "__main__":
     async def run_tests():
@@ -0,0 +1,121 @@
+"""Tests for the vector collection."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+DIM = 8
+
+
+def make_collection(path: Path, n: int = 12):
+    """Build a small collection with deterministic unit vectors."""
+    from research_agent.storage import Collection, Embedding
+
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((n, DIM)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    collection = Collection(name="test", dimension=DIM, path=path)
+    collection.add_batch([
+        Embedding(
+            vector=vectors[i].tolist(),
+            text=f"finding {i}",
+            doc_id=f"doc{i}",
+            metadata={"source_url": f"https://example.com/{i % 3}"},
+        )
+        for i in range(n)
+    ])
+    return collection, vectors
+
+
+class TestCollection:
+    """Tests for Collection."""
+
+    def test_search_batch_matches_search(self, tmp_path):
+        """Test that batched search returns the same results as single searches."""
+        collection, vectors = make_collection(tmp_path)
+
+        batch_results = collection.search_batch(vectors[:3], k=4)
+
+        assert len(batch_results) == 3
+        for vector, results in zip(vectors[:3], batch_results):
+            single = collection.search(vector.tolist(), k=4)
+            assert [r.doc_id for r in results] == [r.doc_id for r in single]
+        assert batch_results[0][0].doc_id == "doc0"
+
+    def test_unique_source_urls(self, tmp_path):
+        """Test that source URLs are deduplicated in first-seen order."""
+        collection, _ = make_collection(tmp_path)
+
+        assert collection.unique_source_urls() == [
+            "https://example.com/0",
+            "https://example.com/1",
+            "https://example.com/2",
+        ]
+
+    def test_keyword_search(self, tmp_path):
+        """Test that full-text search matches words and ignores query punctuation."""
+        collection, _ = make_collection(tmp_path)
+
+        results = collection.keyword_search("finding 7?", k=3)
+
+        assert results[0].doc_id == "doc7"
+        assert collection.keyword_search("!!!") == []
+
+    def test_flush_persists_deferred_index_saves(self, tmp_path):
+        """Test that additions below the save threshold are written by flush."""
+        from research_agent.storage import Collection
+
+        collection, vectors = make_collection(tmp_path)
+        index_path = tmp_path / "test.index"
+        assert not index_path.exists()
+
+        collection.flush()
+
+        reloaded = Collection(name="test", dimension=DIM, path=tmp_path)
+        assert reloaded.search(vectors[5].tolist(), k=1)[0].doc_id == "doc5"
+
+    def test_vectors_are_normalized(self, tmp_path):
+        """Test that unnormalized queries get cosine distances."""
+        collection, vectors = make_collection(tmp_path)
+
+        result = collection.search(vectors[2] * 5.0, k=1)[0]
+
+        assert result.doc_id == "doc2"
+        assert abs(result.distance) < 1e-5
+
+    def test_close_persists_deferred_index_saves(self, tmp_path):
+        """Test that closing a collection writes additions not yet saved."""
+        from research_agent.storage import Collection
+
+        collection, vectors = make_collection(tmp_path)
+        collection.close()
+
+        reloaded = Collection(name="test", dimension=DIM, path=tmp_path)
+        assert reloaded.search(vectors[5].tolist(), k=1)[0].doc_id == "doc5"
+
+    def test_unindexed_rows_can_be_restored(self, tmp_path):
+        """Test that rows whose index save was lost are found and can be re-added."""
+        from research_agent.storage import Collection, Embedding
+
+        collection, vectors = make_collection(tmp_path, n=12)
+        collection.flush()
+        collection.add_batch([
+            Embedding(vector=vectors[i].tolist(), text=f"late {i}", doc_id=f"late{i}")
+            for i in range(3)
+        ])
+        # Reopen without flushing, as after a crash
+        reloaded = Collection(name="test", dimension=DIM, path=tmp_path)
+
+        missing = reloaded.unindexed()
+        assert [text for _, text in missing] == ["late 0", "late 1", "late 2"]
+
+        reloaded.add_vectors([row_id for row_id, _ in missing], vectors[:3] * 2.0)
+
+        assert reloaded.unindexed() == []
+        assert Collection(name="test", dimension=DIM, path=tmp_path).unindexed() == []
+        assert {r.doc_id for r in reloaded.search(vectors[1].tolist(), k=2)} == {"doc1", "late1"}
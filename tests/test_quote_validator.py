@@ -0,0 +1,193 @@
+"""Tests for direct quote validation."""
+
+import asyncio
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+SOURCE = (
+    "The committee announced on Tuesday that the new policy would take effect next year.\n"
+    "Critics argued that the decision was rushed and lacked  public consultation. "
+    "Supporters, however, said the changes were long overdue and would improve transparency."
+)
+
+
+class TestFindExactMatch:
+    """Tests for find_exact_match."""
+
+    def test_verbatim_quote(self):
+        """Test that a verbatim quote is returned unchanged."""
+        from research_agent.tools.quote_validator import find_exact_match
+
+        quote = "lacked  public consultation"
+        assert find_exact_match(quote, SOURCE) == quote
+
+    def test_whitespace_and_case_differences(self):
+        """Test that the source's own words are returned for a reformatted quote."""
+        from research_agent.tools.quote_validator import find_exact_match
+
+        result = find_exact_match("policy WOULD take\neffect next   year.", SOURCE)
+
+        assert result == "policy would take effect next year."
+
+    def test_quote_spanning_lines(self):
+        """Test that a quote matches across a line break in the source."""
+        from research_agent.tools.quote_validator import find_exact_match
+
+        assert find_exact_match("next year. Critics argued", SOURCE) == "next year. Critics argued"
+
+    def test_no_match(self):
+        """Test that a quote not in the source is rejected."""
+        from research_agent.tools.quote_validator import find_exact_match
+
+        assert find_exact_match("the decision was very rushed", SOURCE) is None
+
+    def test_lowercasing_that_changes_length(self):
+        """Test that words after one that grows when lowercased map back correctly."""
+        from research_agent.tools.quote_validator import find_exact_match
+
+        source = "İSTANBUL   hosted the summit on Monday"
+
+        assert find_exact_match("HOSTED the summit", source) == "hosted the summit"
+
+    @pytest.mark.parametrize("quote, source", [("", SOURCE), ("   ", SOURCE), ("policy", "")])
+    def test_empty_input(self, quote, source):
+        """Test that empty quotes and sources never match."""
+        from research_agent.tools.quote_validator import find_exact_match
+
+        assert find_exact_match(quote, source) is None
+
+
+class TestFindFuzzyMatch:
+    """Tests for find_fuzzy_match."""
+
+    def test_verbatim_quote(self):
+        """Test that a verbatim quote is a perfect match."""
+        from research_agent.tools.quote_validator import find_fuzzy_match
+
+        assert find_fuzzy_match("the decision was rushed", SOURCE) == ("the decision was rushed", 1.0)
+
+    def test_typo(self):
+        """Test that a misspelt quote matches the source's spelling."""
+        from research_agent.tools.quote_validator import find_fuzzy_match
+
+        match, ratio = find_fuzzy_match("lacked public consultaton", SOURCE)
+
+        assert match == "lacked public consultation."
+        assert ratio == pytest.approx(0.9615, abs=1e-4)
+
+    def test_typo_in_long_quote(self):
+        """Test that a long quote with a typo matches its whole span."""
+        from research_agent.tools.quote_validator import find_fuzzy_match
+
+        match, ratio = find_fuzzy_match(
+            "the changes were long overdue and would improve transparancy", SOURCE
+        )
+
+        assert match == "the changes were long overdue and would improve transparency."
+        assert ratio > 0.95
+
+    def test_dropped_word(self):
+        """Test that a short quote missing a word matches the full phrase."""
+        from research_agent.tools.quote_validator import find_fuzzy_match
+
+        match, ratio = find_fuzzy_match("Critics argued the decision", SOURCE)
+
+        assert match == "Critics argued that the decision"
+        assert ratio == pytest.approx(0.9153, abs=1e-4)
+
+    def test_inserted_word(self):
+        """Test that a quote with an extra word matches the phrase without it."""
+        from research_agent.tools.quote_validator import find_fuzzy_match
+
+        match, ratio = find_fuzzy_match("the decision was very rushed", SOURCE)
+
+        assert match == "the decision was rushed"
+        assert ratio == pytest.approx(0.9020, abs=1e-4)
+
+    def test_lowercasing_that_changes_length(self):
+        """Test that a fuzzy match after a word that grows when lowercased has the right span."""
+        from research_agent.tools.quote_validator import find_fuzzy_match
+
+        source = "İİİ İSTANBUL hosted the international summit on Monday morning"
+
+        assert find_fuzzy_match("hosted the internatonal summit", source) == (
+            "hosted the international summit",
+            pytest.approx(0.9836, abs=1e-4),
+        )
+
+    def test_short_quote_inside_longer_word(self):
+        """Test that a short quote matches whole words, not the inside of another word."""
+        from research_agent.tools.quote_validator import find_fuzzy_match
+
+        source = "w13 alpha beta gamma delta epsilon zeta eta theta w1 iota"
+
+        assert find_fuzzy_match("w1", source) == ("w1", 1.0)
+
+    def test_below_threshold(self):
+        """Test that a poor match is rejected but still reports its similarity."""
+        from research_agent.tools.quote_validator import find_fuzzy_match
+
+        match, ratio = find_fuzzy_match("changes were overdue", SOURCE)
+
+        assert match is None
+        assert 0.5 < ratio < 0.9
+
+    @pytest.mark.parametrize("quote, source", [("", SOURCE), ("policy", "")])
+    def test_empty_input(self, quote, source):
+        """Test that empty quotes and sources never match."""
+        from research_agent.tools.quote_validator import find_fuzzy_match
+
+        assert find_fuzzy_match(quote, source) == (None, 0.0)
+
+
+class TestValidateDirectQuote:
+    """Tests for validate_direct_quote."""
+
+    @staticmethod
+    def validate(quote: str, page: SimpleNamespace):
+        """Validate a quote against a fake browser that returns `page`."""
+        from research_agent.tools.quote_validator import validate_direct_quote
+
+        class FakeBrowser:
+            async def get_page_content(self, url):
+                return page
+
+        return asyncio.run(validate_direct_quote(quote, "https://example.com", FakeBrowser()))
+
+    def test_valid_quote(self):
+        """Test that a quote found in the page is accepted."""
+        result = self.validate("the decision was rushed", SimpleNamespace(text_content=SOURCE, error=None))
+
+        assert result.valid
+        assert result.matched_text == "the decision was rushed"
+
+    def test_unfetchable_source(self):
+        """Test that a page that couldn't be loaded is reported as a fetch failure."""
+        page = SimpleNamespace(
+            text_content="Skipped page: content type application/pdf is not a web page",
+            error="content type application/pdf is not a web page",
+        )
+
+        result = self.validate("the decision was rushed", page)
+
+        assert not result.valid
+        assert result.error.startswith("Failed to fetch source URL")
+
+    def test_corrected_and_rejected_quotes(self):
+        """Test that near matches are corrected to the source text and others rejected."""
+        page = SimpleNamespace(text_content=SOURCE, error=None)
+
+        corrected = self.validate("lacked public consultaton", page)
+        rejected = self.validate("the committee rejected the policy outright", page)
+
+        assert corrected.valid
+        assert corrected.matched_text == "lacked public consultation."
+        assert corrected.match_ratio < 1.0
+        assert not rejected.valid
+        assert rejected.error.startswith("Quote not found in source")
@@ -0,0 +1,33 @@
+"""Tests for the persistent tool result cache."""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+
+class TestToolResultCache:
+    """Tests for ToolResultCache."""
+
+    def test_round_trip_across_instances(self, tmp_path):
+        """Test that results persist and key on canonical input."""
+        from research_agent.storage.tool_cache import ToolResultCache
+
+        ToolResultCache(tmp_path).set(
+            "web_search", {"query": "q", "num_results": 5}, [{"url": "u"}], ttl=60
+        )
+
+        cache = ToolResultCache(tmp_path)
+        assert cache.get("web_search", {"num_results": 5, "query": "q"}) == [{"url": "u"}]
+        assert cache.get("web_search", {"query": "other"}) is None
+        assert cache.get("get_page_content", {"query": "q", "num_results": 5}) is None
+
+    def test_expired_entries_are_ignored(self, tmp_path):
+        """Test that entries past their TTL are not returned."""
+        from research_agent.storage.tool_cache import ToolResultCache
+
+        cache = ToolResultCache(tmp_path)
+        cache.set("get_page_content", {"url": "u"}, {"content": "c"}, ttl=-1)
+
+        assert cache.get("get_page_content", {"url": "u"}) is None